@@ -11,24 +11,71 @@
 
 """Kaleidoscope"""
 
-import os
+import importlib
+from typing import TYPE_CHECKING
 from kaleidoscope.errors import KaleidoscopeError
 
 # This is needed because version info is only generated
-# at setup.  This should only fall back when not using
-# setup.py lint or style to check.
+# at setup.  Installs without the generated module (e.g. wheels
+# built elsewhere) fall back to the distribution metadata, and
+# only lint or style checks of a bare tree end up at 0.0.0.
 try:
     from .version import version as __version__
 except ImportError:
-    __version__ = '0.0.0'
+    try:
+        from importlib.metadata import (version as _dist_version,
+                                        PackageNotFoundError as _PackageNotFoundError)
+    except ImportError:
+        __version__ = '0.0.0'
+    else:
+        try:
+            __version__ = _dist_version('kaleidoscope')
+        except _PackageNotFoundError:
+            __version__ = '0.0.0'
 
-from kaleidoscope.interactive import *
+# Public plotting routines, imported on first access so that
+# `import kaleidoscope` does not pull in plotly, matplotlib, or scipy.
+_LAZY = {'probability_distribution': 'kaleidoscope.interactive.histogram',
+         'bloch_disc': 'kaleidoscope.interactive.bloch.bloch2d',
+         'bloch_multi_disc': 'kaleidoscope.interactive.bloch.bloch2d',
+         'bloch_sphere': 'kaleidoscope.interactive.bloch.bloch3d',
+         'qsphere': 'kaleidoscope.interactive.qsphere',
+         'PlotlyFigure': 'kaleidoscope.interactive.plotly_wrapper',
+         'PlotlyWidget': 'kaleidoscope.interactive.plotly_wrapper'}
 
-try:
-    from qiskit import QuantumCircuit
-    from qiskit.providers.aer import Aer
-    from qiskit.providers.ibmq import IBMQ
-except ImportError:
-    HAS_QISKIT = False
-else:
-    HAS_QISKIT = True
+# Subpackages that `import kaleidoscope` used to bind as a side effect
+_SUBPACKAGES = ('interactive', 'colors', 'utils')
+
+if TYPE_CHECKING:
+    from kaleidoscope.interactive import *
+
+__all__ = ['KaleidoscopeError'] + list(_LAZY)
+
+
+def _has_qiskit():
+    try:
+        from qiskit import QuantumCircuit
+        from qiskit.providers.aer import Aer
+        from qiskit.providers.ibmq import IBMQ
+    except ImportError:
+        return False
+    return True
+
+
+def __getattr__(name):
+    # Probing for qiskit imports the providers, so only do it when asked.
+    if name == 'HAS_QISKIT':
+        val = _has_qiskit()
+        globals()[name] = val
+        return val
+    if name in _LAZY:
+        val = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = val
+        return val
+    if name in _SUBPACKAGES:
+        return importlib.import_module(f'{__name__}.{name}')
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | set(_SUBPACKAGES) | {'HAS_QISKIT'})
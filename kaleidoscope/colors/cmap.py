@@ -15,22 +15,44 @@
 """Colormap routines"""
 import numpy as np
 
+# Converted colorscales keyed by colormap name, stored with the colormap
+# they were built from.
+_PLOTLY_SCALES = {}
+
 
 def cmap_to_plotly(cmap):
     """Convert a color map to a Plotly RGBA color scale.
 
+    Results are cached by colormap name, so repeated conversions of the
+    same colormap are just a lookup.
+
     Parameters:
         cmap (matplotlib.colors.Colormap): Color map to be converted.
 
     Returns:
         list: RGBA Colorscale.
     """
-    pl_entries = 255
-    hgt = 1.0/(pl_entries-1)
-    pl_colorscale = []
+    cached = _PLOTLY_SCALES.get(cmap.name)
+    # Colormaps are unhashable, and different maps may share a name,
+    # so confirm the cached entry was built from an equal colormap.
+    if cached is None or (cached[0] is not cmap and cached[0] != cmap):
+        cached = (cmap, _cmap_to_plotly(cmap))
+        _PLOTLY_SCALES[cmap.name] = cached
+    return [list(entry) for entry in cached[1]]
+
+
+def _cmap_to_plotly(cmap):
+    """Sample a color map into Plotly color scale entries.
 
-    for k in range(pl_entries):
-        clr = list(map(np.uint8, np.array(cmap(k*hgt)[:3])*255))
-        pl_colorscale.append([k*hgt, 'rgba'+str((clr[0], clr[1], clr[2], 1.0))])
+    Parameters:
+        cmap (matplotlib.colors.Colormap): Color map to be converted.
 
-    return pl_colorscale
+    Returns:
+        tuple: Tuple of (position, RGBA string) pairs.
+    """
+    pl_entries = 255
+    positions = np.linspace(0.0, 1.0, pl_entries)
+    # Output is 8-bit, so sample the whole map at once in single precision
+    rgb = cmap(positions.astype(np.float32), bytes=True)[:, :3].tolist()
+    return tuple((pos, f'rgba({r}, {g}, {b}, 1.0)')
+                 for pos, (r, g, b) in zip(positions.tolist(), rgb))
@@ -14,10 +14,16 @@
 
 """General plotting utility functions"""
 
+import functools
 
+
+@functools.lru_cache(maxsize=512)
 def hex_to_rgb(hex_color):
     """Converts a HEX color to a tuple of RGB values.
 
+    Results are cached, as the same palette colors are parsed
+    over and over when building traces.
+
     Parameters:
         hex_color (str): Input hex color string.
 
@@ -27,7 +33,8 @@ def hex_to_rgb(hex_color):
     hex_color = hex_color.lstrip("#")
     if len(hex_color) == 3:
         hex_color = hex_color * 2
-    return int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16)
+    val = int(hex_color[:6], 16)
+    return (val >> 16) & 0xFF, (val >> 8) & 0xFF, val & 0xFF
 
 
 def find_text_color(hex_str):
@@ -40,8 +47,8 @@ def find_text_color(hex_str):
     Returns:
         str: Output hex color for text
     """
-    (r, g, b) = (hex_str[1:3], hex_str[3:5], hex_str[5:])
-    color = "#ffffff"
-    if 1 - (int(r, 16) * 0.299 + int(g, 16) * 0.587 + int(b, 16) * 0.114) / 255 < 0.5:
-        color = '#000000'
-    return color
+    r, g, b = hex_to_rgb(hex_str)
+    # Luma scaled by 1000, so the 50% threshold is an exact integer compare
+    if r * 299 + g * 587 + b * 114 > 127500:
+        return '#000000'
+    return '#ffffff'
@@ -15,10 +15,10 @@
 """Interactive Bloch discs"""
 
 import math
+import functools
 import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import matplotlib.pyplot as plt
 import matplotlib.colors
 
 from kaleidoscope.utils import pi_check
@@ -28,7 +28,36 @@ from kaleidoscope.colors.utils import hex_to_rgb
 from kaleidoscope.colors import BJY
 from kaleidoscope.colors.cmap import cmap_to_plotly
 
-NORM = plt.Normalize(-1, 1)
+# Sample points and column data for the <Z> colorbar heatmaps
+_ZLIN = np.linspace(-1, 1, 100)
+_ZRANGE = _ZLIN[:, None]
+# Fixed options of the <Z> colorbar heatmaps
+_HEATMAP_KW = dict(showscale=False, hoverinfo='none')
+
+_BLACK_RGB = hex_to_rgb('#000000')
+
+# Largest state (in elements) whose Bloch components are memoized.  The
+# cache keys hold a copy of the state, so this bounds it to 16 x 16 KiB.
+_COMPONENTS_CACHE_SIZE = 2**10
+
+# Sunburst structure and hover text template shared by all Bloch discs
+_LABELS = [" ", "  "]
+_PARENTS = ["", " "]
+_WEDGE_STR = ("\u2329X\u232A= {x}<br>"
+              "\u2329Y\u232A= {y}<br>"
+              "\u2329Z\u232A= {z}<br>"
+              " \u03B8  = {th}<br>"
+              "|\u03C8| = {pur}")
+
+# Bloch vectors shorter than this (maximally mixed qubits) have no meaningful
+# angle, and are drawn as a fixed, nearly transparent disc.
+_MIXED_TOL = 1e-9
+_MIXED_KW = dict(labels=_LABELS,
+                 parents=_PARENTS,
+                 values=[2*np.pi, 0.0],
+                 hoverinfo="text",
+                 hovertext=[_WEDGE_STR.format(x=0.0, y=0.0, z=0.0, th='0', pur=0.0), None],
+                 marker=dict(colors=["rgba(128,128,128,0.05)", "rgba(0,0,0,0.05)"]))
 
 
 def bloch_sunburst(vec, colormap):
@@ -44,43 +73,65 @@ def bloch_sunburst(vec, colormap):
     Raises:
         ValueError: Input vector is not normalized.
     """
+    return _bloch_sunbursts(np.asarray(vec)[None, :], colormap)[0]
+
+
+def _bloch_sunbursts(vecs, colormap):
+    """Create Bloch discs for several sets of Bloch components at once.
+
+    The norms, angles, and colormap lookups are computed for all discs
+    in one pass; only the trace construction is done per disc.
+
+    Parameters:
+        vecs (ndarray): Bloch components, one row per disc.
+        colormap (Colormap): A matplotlib colormap.
+
+    Returns:
+        list: Plotly sunburst traces, one per row of ``vecs``.
+
+    Raises:
+        ValueError: An input vector is not normalized.
+    """
     eps = 1e-6
-    vec = np.asarray(vec)
-    vec_norm = np.linalg.norm(vec)
-    if vec_norm > 1.0 + eps:
-        raise ValueError('Input vector has length {} greater than 1.0'.format(vec_norm))
+    vecs = np.where(np.abs(vecs) < 1e-15, 0, vecs)
+    norms = np.linalg.norm(vecs, axis=1)
+    if norms.max() > 1.0 + eps:
+        raise ValueError('Input vector has length {} greater than 1.0'.format(norms.max()))
 
-    for idx, val in enumerate(vec):
-        if abs(val) < 1e-15:
-            vec[idx] = 0
+    thetas = np.arctan2(vecs[:, 1], vecs[:, 0])
+    thetas = np.where(thetas < 0, 2*np.pi+thetas, thetas)
+    # Linear map of <Z> from [-1, 1] onto the colormap's [0, 1]
+    z_rgbas = colormap(np.clip(0.5*(vecs[:, 2]+1.0), 0.0, 1.0))
 
-    th = math.atan2(vec[1], vec[0])
+    return [go.Sunburst(**_MIXED_KW) if vec_norm < _MIXED_TOL
+            else _sunburst_trace(vec, vec_norm, th, z_rgba)
+            for vec, vec_norm, th, z_rgba in zip(vecs, norms, thetas, z_rgbas)]
 
-    if th < 0:
-        th = 2*np.pi+th
 
-    z_hex = matplotlib.colors.rgb2hex(colormap(NORM(vec[2])))
+def _sunburst_trace(vec, vec_norm, th, z_rgba):
+    """Build the sunburst trace for a single Bloch disc.
 
-    z_color = "rgba({},{},{},{})".format(*hex_to_rgb(z_hex), 0.95*vec_norm+0.05)
-    ring_color = "rgba({},{},{},{})".format(*hex_to_rgb('#000000'), 0.95*vec_norm+0.05)
+    Parameters:
+        vec (ndarray): A vector of Bloch components.
+        vec_norm (float): Norm of the vector.
+        th (float): Azimuthal angle of the vector in [0, 2*pi).
+        z_rgba (ndarray): Colormap RGBA value for the z-component.
 
-    wedge_str = "\u2329X\u232A= {x}<br>"
-    wedge_str += "\u2329Y\u232A= {y}<br>"
-    wedge_str += "\u2329Z\u232A= {z}<br>"
-    wedge_str += " \u03B8  = {th}<br>"
-    wedge_str += "|\u03C8| = {pur}"
+    Returns:
+        go.Sunburst: A Plotly sunburst trace.
+    """
+    z_color, ring_color = _disc_colors(tuple(z_rgba), float(0.95*vec_norm+0.05))
 
-    th_str = pi_check(th, ndigits=3)
-    th_str = th_str.replace('pi', '\u03C0')
+    th_str = _theta_str(float(th))
 
-    hover_text = [wedge_str.format(x=round(vec[0], 3),
-                                   y=round(vec[1], 3),
-                                   z=round(vec[2], 3),
-                                   th=th_str,
-                                   pur=np.round(vec_norm, 3))] + [None]
+    hover_text = [_WEDGE_STR.format(x=round(vec[0], 3),
+                                    y=round(vec[1], 3),
+                                    z=round(vec[2], 3),
+                                    th=th_str,
+                                    pur=np.round(vec_norm, 3)), None]
 
-    bloch = go.Sunburst(labels=[" ", "  "],
-                        parents=["", " "],
+    bloch = go.Sunburst(labels=_LABELS,
+                        parents=_PARENTS,
                         values=[2*np.pi-th, th],
                         hoverinfo="text",
                         hovertext=hover_text,
@@ -88,6 +139,106 @@ def bloch_sunburst(vec, colormap):
     return bloch
 
 
+@functools.lru_cache(maxsize=2048)
+def _disc_colors(z_rgba, alpha):
+    """Plotly color strings for the filled and ring parts of a Bloch disc.
+
+    Product and computational basis states repeat the same colors across
+    qubits and calls, so these are cached.
+
+    Parameters:
+        z_rgba (tuple): Colormap RGBA value for the z-component.
+        alpha (float): Opacity of the disc.
+
+    Returns:
+        tuple: The disc and ring rgba color strings.
+    """
+    r, g, b = hex_to_rgb(matplotlib.colors.rgb2hex(z_rgba))
+    z_color = f"rgba({r},{g},{b},{alpha})"
+    r, g, b = _BLACK_RGB
+    ring_color = f"rgba({r},{g},{b},{alpha})"
+    return z_color, ring_color
+
+
+def _state_data(rho):
+    """Underlying array of a Qiskit Statevector or DensityMatrix.
+
+    Duck-typed on the ``data`` attribute so that Qiskit need not be imported.
+
+    Parameters:
+        rho (list or ndarray or Statevector or DensityMatrix): Input state.
+
+    Returns:
+        list or ndarray: The state data, or the input itself.
+    """
+    # ndarray.data is the raw memory buffer, not the state
+    if isinstance(rho, (list, tuple, np.ndarray)):
+        return rho
+    return getattr(rho, 'data', rho)
+
+
+def _components(rho):
+    """Bloch components of a state, memoized for small states.
+
+    Interactive workflows often redraw the same state, so the
+    components of states up to ``_COMPONENTS_CACHE_SIZE`` elements
+    are cached on the raw state data.
+
+    Parameters:
+        rho (ndarray): Complex statevector or density matrix.
+
+    Returns:
+        list: List of [x,y,z] Bloch components for each qubit.
+    """
+    if rho.size > _COMPONENTS_CACHE_SIZE:
+        return bloch_components(rho)
+    return _cached_components(rho.tobytes(), rho.shape)
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_components(rho_bytes, shape):
+    """Bloch components of a state given by its raw bytes and shape.
+
+    Parameters:
+        rho_bytes (bytes): Raw complex128 state data.
+        shape (tuple): Shape of the state.
+
+    Returns:
+        tuple: Tuple of (x,y,z) Bloch components for each qubit.
+    """
+    rho = np.frombuffer(bytearray(rho_bytes), dtype=complex).reshape(shape)
+    return tuple(tuple(comp) for comp in bloch_components(rho))
+
+
+@functools.lru_cache(maxsize=4096)
+def _theta_str(th):
+    """Hover text for a Bloch disc angle, in multiples of pi where possible.
+
+    Parameters:
+        th (float): Azimuthal angle in [0, 2*pi).
+
+    Returns:
+        str: Angle string using the unicode pi symbol.
+    """
+    return pi_check(th, ndigits=3).replace('pi', '\u03C0')
+
+
+def _add_zbar(fig, colormap, col, tickvals, ticktext):
+    """Add the <Z> colorbar to the last column of a Bloch disc figure.
+
+    Parameters:
+        fig (go.Figure): Figure with an xy subplot at (1, col).
+        colormap (Colormap): A matplotlib colormap.
+        col (int): Subplot column of the colorbar.
+        tickvals (list): Colorbar tick positions, in sample indices.
+        ticktext (list): Colorbar tick labels.
+    """
+    fig.append_trace(go.Heatmap(z=_ZRANGE, colorscale=cmap_to_plotly(colormap), **_HEATMAP_KW),
+                     row=1, col=col)
+    fig.update_yaxes(row=1, col=col, tickvals=tickvals, ticktext=ticktext, side="right")
+    fig.update_xaxes(row=1, col=col, visible=False)
+
+
 def bloch_disc(rho, figsize=None, title=None, colormap=None, as_widget=False):
     """Plot a Bloch disc for a single qubit.
 
@@ -119,13 +270,10 @@ def bloch_disc(rho, figsize=None, title=None, colormap=None, as_widget=False):
             bloch_disc(state)
 
     """
-    # A hack so I do not have to import the actual instances from Qiskit.
-    if rho.__class__.__name__ in ['Statevector', 'DensityMatrix'] \
-            and 'qiskit' in rho.__class__.__module__:
-        rho = rho.data
+    rho = _state_data(rho)
     if len(rho) != 3:
         rho = np.asarray(rho, dtype=complex)
-        comp = bloch_components(rho)
+        comp = _components(rho)
     else:
         comp = [rho]
 
@@ -148,9 +296,8 @@ def bloch_disc(rho, figsize=None, title=None, colormap=None, as_widget=False):
     fig.add_trace(bloch_sunburst(comp[0], colormap), row=1, col=1)
 
     zval = comp[0][2]
-    zrange = [k*np.ones(1) for k in np.linspace(-1, 1, 100)]
-
-    idx = (np.abs(np.linspace(-1, 1, 100) - zval)).argmin()
+    # Nearest of the evenly spaced colorbar samples, -1 + 2*k/99 (lower one on ties)
+    idx = max(0, min(99, math.ceil((zval + 1.0) * 49.5 - 0.5)))
 
     tickvals = np.array([0, 49, 99, idx])
     idx_sort = np.argsort(tickvals)
@@ -166,20 +313,7 @@ def bloch_disc(rho, figsize=None, title=None, colormap=None, as_widget=False):
 
     ticktext = [ticktext[kk] for kk in idx_sort]
 
-    PLOTLY_CMAP = cmap_to_plotly(colormap)
-    fig.append_trace(go.Heatmap(z=zrange,
-                                colorscale=PLOTLY_CMAP,
-                                showscale=False,
-                                hoverinfo='none',
-                                ),
-                     row=1, col=2
-                     )
-
-    fig.update_yaxes(row=1, col=2, tickvals=tickvals,
-                     ticktext=ticktext)
-
-    fig.update_yaxes(row=1, col=2, side="right")
-    fig.update_xaxes(row=1, col=2, visible=False)
+    _add_zbar(fig, colormap, 2, tickvals, ticktext)
 
     fig.update_layout(margin=dict(t=30, l=10, r=0, b=0),
                       height=figsize[0],
@@ -233,14 +367,11 @@ def bloch_multi_disc(rho, figsize=None, titles=True, colormap=None, as_widget=Fa
             state = Statevector.from_instruction(qc)
             bloch_multi_disc(state)
     """
-    # A hack so I do not have to import the actual instances from Qiskit.
-    if rho.__class__.__name__ in ['Statevector', 'DensityMatrix'] \
-            and 'qiskit' in rho.__class__.__module__:
-        rho = rho.data
+    rho = _state_data(rho)
 
     rho = np.asarray(rho, dtype=complex)
 
-    comp = bloch_components(rho)
+    comp = _components(rho)
     num = int(np.log2(rho.shape[0]))
 
     nrows = 1
@@ -262,22 +393,10 @@ def bloch_multi_disc(rho, figsize=None, titles=True, colormap=None, as_widget=Fa
                         subplot_titles=titles,
                         column_widths=[0.95/num]*num+[0.05])
 
-    for jj in range(num):
-        fig.add_trace(bloch_sunburst(comp[jj], colormap), row=1, col=jj+1)
-
-    zrange = [k*np.ones(1) for k in np.linspace(-1, 1, 100)]
-    PLOTLY_CMAP = cmap_to_plotly(colormap)
-    fig.append_trace(go.Heatmap(z=zrange,
-                                colorscale=PLOTLY_CMAP,
-                                showscale=False,
-                                hoverinfo='none',
-                                ),
-                     row=1, col=num+1)
-
-    fig.update_yaxes(row=1, col=num+1, tickvals=[0, 49, 99],
-                     ticktext=[-1, 0, 1])
-    fig.update_yaxes(row=1, col=num+1, side="right")
-    fig.update_xaxes(row=1, col=num+1, visible=False)
+    fig.add_traces(_bloch_sunbursts(np.asarray(comp), colormap),
+                   rows=[1]*num, cols=list(range(1, num+1)))
+
+    _add_zbar(fig, colormap, num+1, [0, 49, 99], [-1, 0, 1])
 
     fig.update_layout(margin=dict(t=50, l=0, r=15, b=30),
                       width=figsize[0],
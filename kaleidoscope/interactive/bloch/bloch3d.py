@@ -14,13 +14,15 @@
 
 """Interactive Bloch sphere"""
 
+import functools
 import numpy as np
 import plotly.graph_objects as go
 from kaleidoscope.colors import COLORS14
 from kaleidoscope.colors.utils import hex_to_rgb
 from kaleidoscope.interactive.plotly_wrapper import PlotlyFigure, PlotlyWidget
-from kaleidoscope.interactive.bloch.primitives import (BSPHERE, LATS, LONGS, ZAXIS, YAXIS, XAXIS,
-                                                       Z0LABEL, Z1LABEL, YLABEL, XLABEL)
+from kaleidoscope.interactive.bloch.primitives import (BSPHERE, ZAXIS, YAXIS, XAXIS,
+                                                       Z0LABEL, Z1LABEL, YLABEL, XLABEL,
+                                                       latitudes, longitudes)
 from kaleidoscope.interactive.bloch.utils import bloch_components
 from kaleidoscope.errors import KaleidoscopeError
 
@@ -90,6 +92,9 @@ def bloch_sphere(vectors=None,
     # Output figure instance
     fig = go.Figure()
 
+    # Traces are collected and added to the figure in one go
+    traces = []
+
     # List for vector annotations, if any
     fig_annotations = []
 
@@ -132,10 +137,10 @@ def bloch_sphere(vectors=None,
         if isinstance(points_alpha, (int, float)):
             points_alpha = [[points_alpha]]
 
+        # All collections go into a single trace with per-marker colors
+        pnts_xyz = []
+        mcolors = []
         for idx, point_collection in enumerate(points):
-            x_pnts = []
-            y_pnts = []
-            z_pnts = []
             if isinstance(points_color[idx], str):
                 _colors = [points_color[idx]]*len(point_collection)
             else:
@@ -143,23 +148,19 @@ def bloch_sphere(vectors=None,
 
             if len(points_alpha[idx]) != len(point_collection):
                 err_str = 'number of alpha values ({}) does not equal number of points ({})'
-                raise ValueError(err_str.format(len(points_alpha[idx]), len(x_pnts)))
-
-            mcolors = []
-            for kk, point in enumerate(point_collection):
-                x_pnts.append(point[0])
-                y_pnts.append(point[1])
-                z_pnts.append(point[2])
-
-                mcolors.append("rgba({},{},{},{})".format(*hex_to_rgb(_colors[kk]),
-                                                          points_alpha[idx][kk]))
-
-            fig.add_trace(go.Scatter3d(x=x_pnts, y=y_pnts, z=z_pnts,
-                                       mode='markers',
-                                       marker=dict(size=7, color=mcolors),
-                                       )
-                          )
-            idx += 1
+                raise ValueError(err_str.format(len(points_alpha[idx]), len(point_collection)))
+
+            pnts_xyz.append(np.asarray(point_collection, dtype=float).reshape(-1, 3))
+            mcolors += [f"rgba({r},{g},{b},{alpha})"
+                        for (r, g, b), alpha in zip(map(hex_to_rgb, _colors), points_alpha[idx])]
+        idx = len(points)
+
+        pnts_xyz = np.concatenate(pnts_xyz)
+        traces.append(go.Scatter3d(x=pnts_xyz[:, 0], y=pnts_xyz[:, 1], z=pnts_xyz[:, 2],
+                                   mode='markers',
+                                   marker=dict(size=7, color=mcolors),
+                                   )
+                      )
 
     if vectors is not None:
 
@@ -207,24 +208,27 @@ def bloch_sphere(vectors=None,
 
         eps = 1e-12
 
-        for idx, vec in enumerate(new_vecs):
-            vec = np.asarray(vec)
-            if np.linalg.norm(vec) > 1.0 + eps:
-                raise ValueError('Vector norm must be <= 1.')
-            # So that line does not go out of arrow head
-            vec_line = vec / 1.05
+        # The stacked array is only for the norm check and line scaling;
+        # the cones and annotations keep each vector's own dtype.
+        vecs = np.asarray(new_vecs, dtype=float)
+        if (np.linalg.norm(vecs, axis=1) > 1.0 + eps).any():
+            raise ValueError('Vector norm must be <= 1.')
+        # So that line does not go out of arrow head
+        vec_lines = vecs / 1.05
 
-            color_str = "rgba({},{},{},{})".format(*hex_to_rgb(vectors_color[idx]),
-                                                   vectors_alpha[idx])
+        for idx, (vec, vec_line) in enumerate(zip(new_vecs, vec_lines)):
+            vec = np.asarray(vec)
+            r, g, b = hex_to_rgb(vectors_color[idx])
+            color_str = f"rgba({r},{g},{b},{vectors_alpha[idx]})"
 
-            fig.add_trace(go.Scatter3d(x=[0, vec_line[0]], y=[0, vec_line[1]], z=[0, vec_line[2]],
+            traces.append(go.Scatter3d(x=[0, vec_line[0]], y=[0, vec_line[1]], z=[0, vec_line[2]],
                                        mode="lines",
                                        hoverinfo=None,
                                        line=dict(color=color_str, width=10)
                                        )
                           )
 
-            fig.add_trace(go.Cone(x=[vec[0]], y=[vec[1]], z=[vec[2]],
+            traces.append(go.Cone(x=[vec[0]], y=[vec[1]], z=[vec[2]],
                                   u=[vec[0]], v=[vec[1]], w=[vec[2]],
                                   sizemode="absolute",
                                   showscale=False,
@@ -254,32 +258,10 @@ def bloch_sphere(vectors=None,
                                                       ),
                                             )
                                        )
-    # Start construction of sphere
-    # Sphere
-    fig.add_trace(BSPHERE())
-
-    # latitudes
-    for kk in LATS:
-        fig.add_trace(kk)
-
-    # longitudes
-    for kk in LONGS:
-        fig.add_trace(kk)
-
-    # z-axis
-    fig.add_trace(ZAXIS)
-    # x-axis
-    fig.add_trace(XAXIS)
-    # y-axis
-    fig.add_trace(YAXIS)
-
-    # zaxis label
-    fig.add_trace(Z0LABEL(fontsize=label_fontsize))
-    fig.add_trace(Z1LABEL(fontsize=label_fontsize))
-    # xaxis label
-    fig.add_trace(XLABEL(fontsize=label_fontsize))
-    # yaxis label
-    fig.add_trace(YLABEL(fontsize=label_fontsize))
+    # Start construction of sphere: surface, latitudes, longitudes, axes, and labels
+    traces.extend(_sphere_traces())
+    traces.extend(_label_traces(label_fontsize))
+    fig.add_traces(traces)
 
     fig.update_layout(width=figsize[0],
                       height=figsize[1],
@@ -312,22 +294,49 @@ def bloch_sphere(vectors=None,
     return PlotlyFigure(fig, modebar=True)
 
 
+@functools.lru_cache(maxsize=1)
+def _sphere_traces():
+    """Traces for the sphere surface, latitudes, longitudes, and axes.
+
+    Returns:
+        tuple: Plotly traces, built once and reused across figures.
+    """
+    return (BSPHERE(), *latitudes(), *longitudes(), ZAXIS, XAXIS, YAXIS)
+
+
+@functools.lru_cache(maxsize=8)
+def _label_traces(fontsize):
+    """Traces for the state labels on the sphere.
+
+    Parameters:
+        fontsize (int): Font size for the labels.
+
+    Returns:
+        tuple: Plotly traces, built once per font size.
+    """
+    return (Z0LABEL(fontsize=fontsize), Z1LABEL(fontsize=fontsize),
+            XLABEL(fontsize=fontsize), YLABEL(fontsize=fontsize))
+
+
 def nest_level(lst):
     """Determine how much nesting is in a list/ ndarray.
 
+    Nesting is probed along the first element only, so the cost
+    depends on the depth and not on the number of elements.
+
     Parameters:
         lst (list or ndarray): Input array-like object.
 
     Returns:
         int: Level of nesting.
     """
-    if not isinstance(lst, (list, np.ndarray)):
-        return 0
-    if isinstance(lst, list):
-        if not lst:
-            return 1
-    else:
-        if isinstance(lst, np.ndarray):
-            if not all(lst):
-                return 1
-    return max(nest_level(item) for item in lst) + 1
+    depth = 0
+    cur = lst
+    while isinstance(cur, (list, np.ndarray)):
+        if isinstance(cur, np.ndarray):
+            return depth + cur.ndim
+        depth += 1
+        if not cur:
+            return depth
+        cur = cur[0]
+    return depth
@@ -14,19 +14,78 @@
 
 """Primitives for building a 3D sphere"""
 
+import copy
+import functools
 import numpy as np
 import plotly.graph_objects as go
 
-u = np.linspace(0, 2*np.pi, 100)
-v = np.linspace(0, 2*np.pi, 100)
-x = np.outer(np.cos(u), np.sin(v))
-y = np.outer(np.sin(u), np.sin(v))
-z = np.outer(np.ones(np.size(u)), np.cos(v))
+
+@functools.lru_cache(maxsize=1)
+def _circle():
+    """Sine and cosine of the angles used for the sphere mesh.
+
+    Built on first use, so importing this module costs nothing for
+    callers that never draw a sphere.  The mesh is purely decorative,
+    so single precision is plenty.
+
+    Returns:
+        tuple: Read-only (sin, cos) arrays.
+    """
+    ang = np.linspace(0, 2*np.pi, 100, dtype=np.float32)
+    sin, cos = np.sin(ang), np.cos(ang)
+    # Shared by every cached trace, so guard against accidental modification
+    for arr in (sin, cos):
+        arr.setflags(write=False)
+    return sin, cos
+
+
+@functools.lru_cache(maxsize=1)
+def _sphere_mesh():
+    """Cartesian coordinates of the sphere surface mesh.
+
+    Returns:
+        tuple: Read-only (x, y, z) arrays.
+    """
+    sin, cos = _circle()
+    x = np.multiply.outer(cos, sin)
+    y = np.multiply.outer(sin, sin)
+    z = np.multiply.outer(np.ones_like(cos), cos)
+    for arr in (x, y, z):
+        arr.setflags(write=False)
+    return x, y, z
+
+
+@functools.lru_cache(maxsize=16)
+def _sphere_surface(color, opacity):
+    """Sphere surface trace for a given color and opacity.
+
+    Parameters:
+        color (str): Hex color for sphere.
+        opacity (float): Opacity of sphere.
+
+    Returns:
+        surface: Plotly Surface trace.
+    """
+    x, y, z = _sphere_mesh()
+    return go.Surface(x=x, y=y, z=z,
+                      opacity=opacity,
+                      showscale=False,
+                      hoverinfo='skip',
+                      colorscale=[[0, color],
+                                  [1, color]],
+                      contours=dict(
+                          x=dict(highlight=False),
+                          y=dict(highlight=False),
+                          z=dict(highlight=False))
+                      )
 
 
 def BSPHERE(color="#F1EBEA", opacity=0.15):
     """Surface of sphere.
 
+    Traces are cached per color and opacity, and each call gets its
+    own copy so callers are free to modify it.
+
     Parameters:
         color (str): Hex color for sphere.
         opacity (float): Opacity of sphere.
@@ -34,18 +93,22 @@ def BSPHERE(color="#F1EBEA", opacity=0.15):
     Returns:
         surface: Plotly Surface trace.
     """
-    surface = go.Surface(x=x, y=y, z=z,
-                         opacity=opacity,
-                         showscale=False,
-                         hoverinfo='skip',
-                         colorscale=[[0, color],
-                                     [1, color]],
-                         contours=dict(
-                             x=dict(highlight=False),
-                             y=dict(highlight=False),
-                             z=dict(highlight=False))
-                         )
-    return surface
+    return copy.copy(_sphere_surface(color, opacity))
+
+
+@functools.lru_cache(maxsize=1)
+def _legacy_mesh():
+    """Double precision mesh arrays formerly exposed as module globals.
+
+    Returns:
+        dict: The ``u``, ``v``, ``x``, ``y``, and ``z`` arrays.
+    """
+    u = np.linspace(0, 2*np.pi, 100)
+    v = np.linspace(0, 2*np.pi, 100)
+    return {'u': u, 'v': v,
+            'x': np.outer(np.cos(u), np.sin(v)),
+            'y': np.outer(np.sin(u), np.sin(v)),
+            'z': np.outer(np.ones(np.size(u)), np.cos(v))}
 
 
 def latitudes(num_lines=7):
@@ -57,24 +120,21 @@ def latitudes(num_lines=7):
     Returns:
         list: List of Plotly traces.
     """
-    lats = []
-    for th in np.linspace(0, np.pi, num_lines):
-        xvals = np.sin(th)*np.cos(u)
-        yvals = np.sin(th)*np.sin(u)
-        zvals = np.cos(th)*np.ones_like(u)
-        lats.append(go.Scatter3d(
-            x=xvals, y=yvals, z=zvals,
-            mode="lines",
-            hoverinfo='skip',
-            line=dict(
-                color='#1e1e1e' if th == np.pi/2 else '#373737',
-                width=2 if th == np.pi/2 else 1
-            )
-        ))
-    return lats
-
-
-LATS = latitudes()
+    sin, cos = _circle()
+    # Angles stay in double precision so that the equator test is exact
+    th = np.linspace(0, np.pi, num_lines)
+    equator = th == np.pi/2
+    sin_th = np.sin(th).astype(np.float32)[:, None]
+    xvals = sin_th * cos
+    yvals = sin_th * sin
+    zvals = np.repeat(np.cos(th).astype(np.float32)[:, None], cos.shape[0], axis=1)
+    colors = np.where(equator, '#1e1e1e', '#373737').tolist()
+    widths = np.where(equator, 2, 1).tolist()
+    return [go.Scatter3d(x=xvals[kk], y=yvals[kk], z=zvals[kk],
+                         mode="lines",
+                         hoverinfo='skip',
+                         line=dict(color=colors[kk], width=widths[kk]))
+            for kk in range(num_lines)]
 
 
 def longitudes(num_lines=7):
@@ -86,22 +146,32 @@ def longitudes(num_lines=7):
     Returns:
         list: List of Plotly traces.
     """
-    longi = []
-    for th in np.linspace(0, 2*np.pi, num_lines):
-        xvals = np.cos(th)*np.sin(u)*np.ones_like(u)
-        yvals = np.sin(th)*np.sin(u)*np.ones_like(u)
-        zvals = np.cos(u)
-        longi.append(go.Scatter3d(x=xvals, y=yvals, z=zvals,
-                                  mode="lines",
-                                  hoverinfo='skip',
-                                  line=dict(color='#373737',
-                                            width=1)
-                                  )
-                     )
-    return longi
+    sin, cos = _circle()
+    th = np.linspace(0, 2*np.pi, num_lines)
+    xvals = np.cos(th).astype(np.float32)[:, None] * sin
+    yvals = np.sin(th).astype(np.float32)[:, None] * sin
+    return [go.Scatter3d(x=xvals[kk], y=yvals[kk], z=cos,
+                         mode="lines",
+                         hoverinfo='skip',
+                         line=dict(color='#373737', width=1))
+            for kk in range(num_lines)]
+
+
+# Default latitude and longitude traces, built on first access
+_LAZY = {'LATS': latitudes, 'LONGS': longitudes}
+
 
+def __getattr__(name):
+    if name in _LAZY:
+        val = _LAZY[name]()
+        globals()[name] = val
+        return val
+    if name in ('u', 'v', 'x', 'y', 'z'):
+        val = _legacy_mesh()[name]
+        globals()[name] = val
+        return val
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
 
-LONGS = longitudes()
 
 ZAXIS = go.Scatter3d(x=[0, 0], y=[0, 0], z=[-1, 1],
                      mode="lines",
@@ -14,27 +14,43 @@
 
 """Interactive plotting utility functions"""
 
+import os
 import numpy as np
 import scipy.sparse as sp
-from numba import vectorize, uint32, int32, complex128, jit, prange
+from numba import vectorize, uint32, int32, complex128, jit, njit, prange
 
 
-@vectorize([uint32(uint32)], target='parallel', nopython=True, cache=True)
-def count_set_bits(val):
-    """Computes the number of set bits in a uint32 value.
+if hasattr(np, 'bitwise_count'):
+    def count_set_bits(val):
+        """Computes the number of set bits in uint32 values.
 
-    Parameters:
-        val (uint32): Input unsigned int.
+        Uses the hardware popcount exposed by ``np.bitwise_count`` (NumPy >= 2.0).
 
-    Returns:
-        uint32: Output unsigned int.
-    """
-    val = (val & 0x55555555) + ((val >> 1) & 0x55555555)
-    val = (val & 0x33333333) + ((val >> 2) & 0x33333333)
-    val = (val & 0x0f0f0f0f) + ((val >> 4) & 0x0f0f0f0f)
-    val = (val & 0x00ff00ff) + ((val >> 8) & 0x00ff00ff)
-    val = (val & 0x0000ffff) + ((val >> 16) & 0x0000ffff)
-    return val
+        Parameters:
+            val (ndarray): Input unsigned ints.
+
+        Returns:
+            ndarray: Number of set bits in each element.
+        """
+        return np.bitwise_count(np.asarray(val, dtype=np.uint32))
+else:
+    # Serial target: the arrays are small enough that a thread pool only adds overhead.
+    @vectorize([uint32(uint32)], nopython=True, cache=True)
+    def count_set_bits(val):
+        """Computes the number of set bits in a uint32 value.
+
+        Parameters:
+            val (uint32): Input unsigned int.
+
+        Returns:
+            uint32: Output unsigned int.
+        """
+        val = (val & 0x55555555) + ((val >> 1) & 0x55555555)
+        val = (val & 0x33333333) + ((val >> 2) & 0x33333333)
+        val = (val & 0x0f0f0f0f) + ((val >> 4) & 0x0f0f0f0f)
+        val = (val & 0x00ff00ff) + ((val >> 8) & 0x00ff00ff)
+        val = (val & 0x0000ffff) + ((val >> 16) & 0x0000ffff)
+        return val
 
 
 @jit(complex128(complex128[:], int32[:], int32[:], complex128[:]),
@@ -65,8 +81,64 @@ def expect_psi_csr(data, ind, ptr, vec):
     return expt
 
 
-def sparse_pauli(num_qubits, idx, kind):
-    """Returns a sparse CSR pauli matrix.
+@njit(cache=True)
+def qubit_bloch_psi(vec, qubit):
+    """Computes the Bloch components of a single qubit of a statevector.
+
+    Each single-qubit Pauli has one nonzero per row: X and Y couple
+    row ``r`` to ``r ^ (1 << qubit)`` and Y and Z carry a sign set by
+    bit ``qubit`` of ``r``.  So all three expectation values are
+    accumulated in a single pass over the statevector, without
+    building the operators.
+
+    Parameters:
+        vec (ndarray): A complex128 array for the statevector.
+        qubit (int): Index of the qubit.
+
+    Returns:
+        tuple: The (x, y, z) Bloch components.
+    """
+    mask = 1 << qubit
+    ex = 0.0
+    ey = 0.0
+    ez = 0.0
+    for row in range(vec.shape[0]):
+        amp = vec[row]
+        prod = np.conj(amp)*vec[row ^ mask]
+        sign = 1.0 - 2.0*((row >> qubit) & 1)
+        ex += prod.real
+        ey += sign*prod.imag
+        ez += sign*(amp.real*amp.real + amp.imag*amp.imag)
+    return ex, ey, ez
+
+
+@njit(parallel=True, cache=True)
+def bloch_psi(vec, num_qubits):
+    """Computes the Bloch components of every qubit of a statevector.
+
+    The qubits are independent, so they are processed in parallel.
+
+    Parameters:
+        vec (ndarray): A complex128 array for the statevector.
+        num_qubits (int): Number of qubits in the statevector.
+
+    Returns:
+        ndarray: A (num_qubits, 3) array of Bloch components.
+    """
+    out = np.empty((num_qubits, 3))
+    for qubit in prange(num_qubits):  # pylint: disable=not-an-iterable
+        ex, ey, ez = qubit_bloch_psi(vec, qubit)
+        out[qubit, 0] = ex
+        out[qubit, 1] = ey
+        out[qubit, 2] = ez
+    return out
+
+
+def pauli_action(num_qubits, idx, kind):
+    """Returns the nonzero values and their columns for a single-qubit Pauli.
+
+    A Pauli operator has exactly one nonzero per row, so it is fully
+    described by the value and column index of that entry in each row.
 
     Parameters:
         num_qubits (int): The number of qubits in the statevector.
@@ -74,7 +146,7 @@ def sparse_pauli(num_qubits, idx, kind):
         kind (str): The kind of Pauli, 'X', 'Y', or 'Z'.
 
     Returns:
-        csr_matrix: A Pauli operator as a sparse CSR matrix.
+        tuple: Complex data and int64 column indices, one entry per row.
 
     Raises:
         ValueError: Invalid 'kind' given.
@@ -93,11 +165,35 @@ def sparse_pauli(num_qubits, idx, kind):
     n = 2**num_qubits
     xs = 2**idx if x else 0
     zs = 2**idx if z else 0
-    rows = np.arange(n+1, dtype=np.uint32)
+    rows = np.arange(n, dtype=np.int64)
     columns = rows ^ xs
-    global_factor = (-1j)**(x*z)
-    data = global_factor*(-1)**np.mod(count_set_bits(zs & rows), 2)
-    return sp.csr_matrix((data, columns, rows), shape=(n, n))
+    if not z:
+        return np.ones(n, dtype=np.complex128), columns
+    global_factor = (-1j)**x
+    # (-1)**parity as an integer sign, avoiding a complex power
+    parity = (count_set_bits((zs & rows).astype(np.uint32)) & 1).astype(np.int8)
+    data = (1 - 2*parity)*np.complex128(global_factor)
+    return data, columns
+
+
+def sparse_pauli(num_qubits, idx, kind):
+    """Returns a sparse CSR pauli matrix.
+
+    Parameters:
+        num_qubits (int): The number of qubits in the statevector.
+        idx (int): The index (qubit) on which the Pauli acts.
+        kind (str): The kind of Pauli, 'X', 'Y', or 'Z'.
+
+    Returns:
+        csr_matrix: A Pauli operator as a sparse CSR matrix.
+
+    Raises:
+        ValueError: Invalid 'kind' given.
+    """
+    data, columns = pauli_action(num_qubits, idx, kind)
+    n = data.shape[0]
+    indptr = np.arange(n+1, dtype=np.int64)
+    return sp.csr_matrix((data, columns, indptr), shape=(n, n))
 
 
 def bloch_components(rho):
@@ -122,21 +218,44 @@ def bloch_components(rho):
     num = int(num)
     dims = len(rho.shape)
 
+    if dims == 1:
+        vec = np.asarray(rho, dtype=np.complex128)
+        return bloch_psi(vec, num).tolist()
+
+    # Each Pauli has one nonzero per row, so Tr(P rho) = sum_i P[i, c_i] rho[c_i, i].
+    rho = np.asarray(rho)
+    rows = np.arange(rho.shape[0])
     out = []
     for i in range(num):
-        pauli_singles = [
-            sparse_pauli(num, i, 'X'),
-            sparse_pauli(num, i, 'Y'),
-            sparse_pauli(num, i, 'Z')
-        ]
-        if dims == 1:
-            out.append(list(
-                map(lambda x: np.real(expect_psi_csr(x.data, x.indices, x.indptr, rho)),
-                    pauli_singles)))
-
-        else:
-            out.append(list(
-                map(lambda x: np.real(np.trace(x.dot(rho))),
-                    pauli_singles)))
+        comps = []
+        for kind in 'XYZ':
+            data, cols = pauli_action(num, i, kind)
+            comps.append(np.real(np.dot(data, rho[cols, rows])))
+        out.append(comps)
 
     return out
+
+
+def _warm_kernels():
+    """Compiles (or loads from cache) the lazily-typed Bloch kernels.
+
+    Calling ``bloch_psi`` once on a tiny statevector moves the JIT cost
+    from the first Bloch plot to import time; ``qubit_bloch_psi`` is
+    compiled along with it, and ``count_set_bits`` is either eagerly
+    typed or a NumPy ufunc.  The qsphere kernel is warmed by its own
+    module.  Compilation failures are ignored here so that they surface
+    at the real call site instead.
+    """
+    vec = np.zeros(2, dtype=np.complex128)
+    vec[0] = 1
+    try:
+        bloch_psi(vec, 1)
+    except Exception:  # pylint: disable=broad-except
+        pass
+
+
+# Opt-in warm-up of the Numba kernels at import, see docs/install.rst
+_PRECOMPILE = os.environ.get('KALEIDOSCOPE_PRECOMPILE', '0') not in ('', '0')
+
+if _PRECOMPILE:
+    _warm_kernels()
@@ -29,7 +29,6 @@
 
 """Interactive histogram from experiment counts"""
 
-import functools
 from collections import Counter, OrderedDict
 import numpy as np
 import plotly.graph_objects as go
@@ -38,6 +37,9 @@ from kaleidoscope.colors import COLORS1, COLORS2, COLORS3, COLORS4, COLORS5, COL
 from kaleidoscope.colors.utils import find_text_color
 from .plotly_wrapper import PlotlyWidget, PlotlyFigure
 
+# np.bitwise_count needs NumPy >= 2.0
+_HAS_BITWISE_COUNT = hasattr(np, 'bitwise_count')
+
 
 def hamming_distance(str1, str2):
     """Calculate the Hamming distance between two bit strings
@@ -52,11 +54,58 @@ def hamming_distance(str1, str2):
     """
     if len(str1) != len(str2):
         raise ValueError('Strings not same length.')
-    return sum(s1 != s2 for s1, s2 in zip(str1, str2))
+    try:
+        bytes1 = np.frombuffer(str1.encode('ascii'), dtype=np.uint8)
+        bytes2 = np.frombuffer(str2.encode('ascii'), dtype=np.uint8)
+    except UnicodeEncodeError:
+        return sum(s1 != s2 for s1, s2 in zip(str1, str2))
+    return int(np.count_nonzero(bytes1 != bytes2))
+
+
+def _hamming_distances(labels, target_string):
+    """Calculate the Hamming distances of many bit strings to a target.
+
+    Args:
+        labels (list): Bit strings, all of the target's length.
+        target_string (str): Target string.
+    Returns:
+        ndarray: Distance of each label to the target.
+    Raises:
+        ValueError: Strings not same length
+    """
+    num_bits = len(target_string)
+    if any(len(label) != num_bits for label in labels):
+        raise ValueError('Strings not same length.')
+    try:
+        label_bytes = np.frombuffer(''.join(labels).encode('ascii'), dtype=np.uint8)
+        target_bytes = np.frombuffer(target_string.encode('ascii'), dtype=np.uint8)
+    except UnicodeEncodeError:
+        return np.array([hamming_distance(label, target_string) for label in labels])
+    label_bytes = label_bytes.reshape(len(labels), num_bits)
+    # Past one machine word, packing '0'/'1' strings eight bits per byte and
+    # counting set bits of the XOR touches an eighth of the memory.
+    if (num_bits > 64 and _HAS_BITWISE_COUNT
+            and _is_bitstring(label_bytes) and _is_bitstring(target_bytes)):
+        packed = np.packbits(label_bytes == 49, axis=1)
+        target_packed = np.packbits(target_bytes == 49)
+        return np.bitwise_count(packed ^ target_packed).sum(axis=1, dtype=np.intp)
+    return np.count_nonzero(label_bytes != target_bytes, axis=1)
+
+
+def _is_bitstring(arr):
+    """Check that ASCII bytes only contain the characters '0' and '1'.
+
+    Args:
+        arr (ndarray): Array of uint8 character codes.
+    Returns:
+        bool: True if every byte is '0' (48) or '1' (49).
+    """
+    return bool(np.all((arr | 1) == 49))
 
 
 VALID_SORTS = ['asc', 'desc', 'hamming']
-DIST_MEAS = {'hamming': hamming_distance}
+# Distance measures map a list of labels and a target string to an array of distances
+DIST_MEAS = {'hamming': _hamming_distances}
 
 
 def probability_distribution(data, figsize=(None, None), colors=None,
@@ -141,18 +190,13 @@ def probability_distribution(data, figsize=(None, None), colors=None,
 
     text_color = find_text_color(background_color)
 
-    labels = list(sorted(
-        functools.reduce(lambda x, y: x.union(y.keys()), data, set())))
+    labels = sorted(set().union(*(d.keys() for d in data)))
     if number_to_keep is not None:
         labels.append('rest')
 
     if sort in DIST_MEAS:
-        dist = []
-        for item in labels:
-            dist.append(DIST_MEAS[sort](item, target_string))
-
-        labels = [list(x) for x in zip(*sorted(zip(dist, labels),
-                                               key=lambda pair: pair[0]))][1]
+        dist = DIST_MEAS[sort](labels, target_string)
+        labels = [labels[kk] for kk in np.argsort(dist, kind='stable')]
     # Set bar colors
     if colors is None:
         if len(data) == 1:
@@ -176,25 +220,22 @@ def probability_distribution(data, figsize=(None, None), colors=None,
                                                        labels,
                                                        number_to_keep)
 
+    labels = list(labels_dict.keys())
+    if state_labels_kind == 'ints':
+        labels = [int(label, 2) for label in labels]
+    if state_labels:
+        if len(state_labels) != len(labels):
+            raise KaleidoscopeError('Number of input state labels does not match data.')
+        labels = state_labels
+
     fig = go.Figure()
     for item, _ in enumerate(data):
-        xvals = []
-        yvals = []
-        for idx, val in enumerate(all_pvalues[item]):
-            xvals.append(idx+item*width)
-            yvals.append(val)
-
-        labels = list(labels_dict.keys())
-        if state_labels_kind == 'ints':
-            labels = [int(label, 2) for label in labels]
-        if state_labels:
-            if len(state_labels) != len(labels):
-                raise KaleidoscopeError('Number of input state labels does not match data.')
-            labels = state_labels
-
-        hover_template = "<b>{x}</b><br>P = {y}"
-        hover_text = [hover_template.format(x=labels[kk],
-                                            y=np.round(yvals[kk], 3)) for kk in range(len(yvals))]
+        yvals = all_pvalues[item]
+        xvals = np.arange(len(yvals), dtype=np.float64) + item*width
+        rounded = np.round(yvals, 3)
+
+        hover_text = [f"<b>{label}</b><br>P = {prob}"
+                      for label, prob in zip(labels, rounded.tolist())]
 
         fig.add_trace(go.Bar(x=xvals,
                              y=yvals,
@@ -203,7 +244,7 @@ def probability_distribution(data, figsize=(None, None), colors=None,
                              hovertext=hover_text,
                              marker_color=colors[item % len(colors)],
                              name=legend[item] if legend else '',
-                             text=np.round(yvals, 3) if bar_labels else None,
+                             text=rounded if bar_labels else None,
                              textposition='auto'
                              ))
 
@@ -238,7 +279,7 @@ def probability_distribution(data, figsize=(None, None), colors=None,
         fig.update_yaxes(type="log", range=[lower, 0])
         fig.update_layout(yaxis=dict(tickmode='array',
                           tickvals=[10**k for k in range(lower, 1)],
-                          ticktext=["10<sup>{}</sup>".format(k) for k in range(lower, 1)]
+                          ticktext=[f"10<sup>{k}</sup>" for k in range(lower, 1)]
                           ))
 
     fig.update_layout(xaxis_tickangle=-70,
@@ -276,31 +317,34 @@ def _plot_histogram_data(data, labels, number_to_keep):
     """
     labels_dict = OrderedDict()
 
-    all_pvalues = []
-    all_inds = []
-    for execution in data:
+    # One row of counts per experiment, normalized together below
+    values = np.empty((len(data), len(labels)))
+    for row, execution in zip(values, data):
         if number_to_keep is not None:
             data_temp = dict(Counter(execution).most_common(number_to_keep))
             data_temp["rest"] = sum(execution.values()) - sum(data_temp.values())
             execution = data_temp
-        values = []
-        for key in labels:
-            if key not in execution:
-                if number_to_keep is None:
-                    labels_dict[key] = 1
-                    values.append(0)
-                else:
-                    values.append(-1)
-            else:
-                labels_dict[key] = 1
-                values.append(execution[key])
-        values = np.array(values, dtype=float)
-        where_idx = np.where(values >= 0)[0]
-        pvalues = values[where_idx] / sum(values[where_idx])
-
-        all_pvalues.append(pvalues)
-        numelem = len(values[where_idx])
-        ind = np.arange(numelem)  # the x locations for the groups
-        all_inds.append(ind)
+            # Labels outside the kept terms are marked with -1 and dropped
+            missing = -1
+        else:
+            missing = 0
+        get = execution.get
+        row[:] = np.fromiter((get(key, missing) for key in labels),
+                             dtype=float, count=len(labels))
+
+    mask = values >= 0
+    pvalues = values / np.where(mask, values, 0).sum(axis=1, keepdims=True)
+    if number_to_keep is None:
+        labels_dict.update(dict.fromkeys(labels, 1))
+        all_pvalues = list(pvalues)
+        all_inds = [np.arange(len(labels)) for _ in data]
+    else:
+        all_pvalues = []
+        all_inds = []
+        for prow, mrow in zip(pvalues, mask):
+            where_idx = np.flatnonzero(mrow)
+            labels_dict.update(dict.fromkeys([labels[kk] for kk in where_idx], 1))
+            all_pvalues.append(prow[where_idx])
+            all_inds.append(np.arange(where_idx.shape[0]))
 
     return labels_dict, all_pvalues, all_inds
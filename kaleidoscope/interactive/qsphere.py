@@ -17,14 +17,29 @@
 
 import numpy as np
 import scipy.linalg as la
-import scipy.special as spsp
 import matplotlib as mpl
 import colorcet as cc
+from numba import njit, prange
 from plotly.subplots import make_subplots
 import plotly.graph_objects as go
 from kaleidoscope.errors import KaleidoscopeError
 from .plotly_wrapper import PlotlyWidget, PlotlyFigure
 from .bloch.primitives import BSPHERE
+from .bloch.utils import _PRECOMPILE
+
+# Phase colormap, and the colors of the slices in the phase wheel legend
+_NORM = mpl.colors.Normalize(vmin=0, vmax=2*np.pi)
+_CMAP = cc.cm.CET_C1s
+_PHASE_SLICES = 128
+_PHASE_COLORS = [mpl.colors.rgb2hex(_CMAP(_NORM(2*np.pi*kk/_PHASE_SLICES)))
+                 for kk in range(_PHASE_SLICES)]
+# Hex color of every colormap entry, indexed the same way the colormap is
+_HEX_LUT = [mpl.colors.rgb2hex(rgba) for rgba in _CMAP(np.arange(_CMAP.N))]
+
+# Above this many drawn amplitudes, hover and spikes are turned off
+_DENSE_HOVER_LIMIT = 512
+# Most basis states drawn, keeping the largest probabilities
+_MAX_DRAWN = 4096
 
 
 def qsphere(state, state_labels=True,
@@ -33,6 +48,8 @@ def qsphere(state, state_labels=True,
     """Plots a statevector of qubits using the qsphere
     representation.
 
+    Only the 4096 most probable basis states are drawn.
+
     Parameters:
         state (ndarray): Statevector as 1D NumPy array.
         state_labels (bool): Show state labels.
@@ -70,66 +87,50 @@ def qsphere(state, state_labels=True,
     if state.__class__.__name__ in ['DensityMatrix'] \
             and 'qiskit' in state.__class__.__module__:
 
-        if not abs(1-state.data.dot(state.data).trace().real) < 1e-6:
+        if not abs(1-_purity(state.data)) < 1e-6:
             raise KaleidoscopeError('Input density matrix is not a pure state.')
-        # pylint: disable=unexpected-keyword-arg
-        _, evecs = la.eig(state.data)
-        state = evecs[0].ravel()
+        state = _leading_eigvec(state.data)
 
     if len(state.shape) == 2:
-        if not abs(1-state.dot(state).trace().real) < 1e-6:
+        if not abs(1-_purity(state)) < 1e-6:
             raise KaleidoscopeError('Input density matrix is not a pure state.')
-        # pylint: disable=unexpected-keyword-arg
-        _, evecs = la.eig(state.data)
-        state = evecs[0].ravel()
+        state = _leading_eigvec(state)
 
     if len(state.shape) != 1:
         raise KaleidoscopeError('Input state is not 1D array.')
 
-    if np.log2(state.shape[0]) % 1:
+    dim = state.shape[0]
+    # Power-of-two check done exactly in integers
+    if dim <= 0 or dim & (dim - 1):
         raise KaleidoscopeError('Input is not a valid statevector of qubits.')
 
     eps = 1e-8
-    norm = mpl.colors.Normalize(vmin=0, vmax=2*np.pi)
-    cmap = cc.cm.CET_C1s
-    num_qubits = int(np.log2(state.shape[0]))
-
-    xvals = []
-    yvals = []
-    zvals = []
-    colors = []
-    bases = []
-    probs = []
-    marker_sizes = []
-
-    for idx in range(2**num_qubits):
-        prob = (state[idx]*state[idx].conj()).real
-        if prob > eps:
-            elem = bin(idx)[2:].zfill(num_qubits)
-            weight = elem.count("1")
-            zvalue = -2 * weight / num_qubits + 1
-            number_of_divisions = spsp.comb(num_qubits, weight)
-            weight_order = _bit_string_index(elem)
-            angle = (float(weight) / num_qubits) * (np.pi * 2) + \
-                    (weight_order * 2 * (np.pi / number_of_divisions))
-
-            if (weight > num_qubits / 2) or (((weight == num_qubits / 2) and
-                                              (weight_order >= number_of_divisions / 2))):
-                angle = np.pi - angle - (2 * np.pi / number_of_divisions)
-
-            xvalue = np.sqrt(1 - zvalue ** 2) * np.cos(angle)
-            yvalue = np.sqrt(1 - zvalue ** 2) * np.sin(angle)
-
-            bases.append(elem)
-            probs.append(prob)
-            xvals.append(xvalue)
-            yvals.append(yvalue)
-            zvals.append(zvalue)
-
-            phase = np.arctan2(state[idx].imag, state[idx].real)
-            phase = phase if phase >= 0 else phase+2*np.pi
-            colors.append(mpl.colors.rgb2hex(cmap(norm(phase))))
-            marker_sizes.append(np.sqrt(prob) * 40)
+    num_qubits = dim.bit_length() - 1
+
+    # Only the non-negligible amplitudes are drawn.  Screening them only
+    # needs single precision, which halves the data in the full-length pass;
+    # the phases of the kept amplitudes still come from the full-precision state.
+    re_part = state.real.astype(np.float32)
+    im_part = state.imag.astype(np.float32)
+    all_probs = re_part*re_part + im_part*im_part
+    idx = np.flatnonzero(all_probs > eps)
+    if idx.shape[0] > _MAX_DRAWN:
+        # Keep the most probable states; the rest are sub-pixel markers
+        top = np.argpartition(all_probs[idx], -_MAX_DRAWN)[-_MAX_DRAWN:]
+        idx = np.sort(idx[top])
+    amps = state[idx]
+    probs = all_probs[idx]
+    # Hover lookups over many points make dense states sluggish to interact with
+    dense = idx.shape[0] > _DENSE_HOVER_LIMIT
+    hover = 'skip' if dense else None
+
+    bases = [bin(kk)[2:].zfill(num_qubits) for kk in idx.tolist()]
+    xvals, yvals, zvals, phase = _qsphere_geometry(idx, amps.astype(np.complex128),
+                                                   num_qubits, _BINOM)
+    xvals, yvals, zvals = xvals.tolist(), yvals.tolist(), zvals.tolist()
+    lut_idx = np.minimum((_NORM(phase).filled() * _CMAP.N).astype(np.intp), _CMAP.N - 1)
+    colors = [_HEX_LUT[kk] for kk in lut_idx.tolist()]
+    marker_sizes = (np.sqrt(probs, dtype=np.float64) * 40).tolist()
 
     if state_labels_kind == 'ints':
         bases = [int(kk, 2) for kk in bases]
@@ -149,78 +150,56 @@ def qsphere(state, state_labels=True,
 
     figsize = (350, 350)
 
-    # List for vector annotations, if any
-    fig_annotations = []
-
     fig.add_trace(BSPHERE(), row=1, col=1)
 
     # latitudes
     for kk in _qsphere_latitudes(zvals):
         fig.add_trace(kk, row=1, col=1)
 
-    fig.add_trace(go.Scatter3d(x=[0], y=[0], z=[0],
-                               mode='markers',
-                               opacity=0.6,
-                               marker=dict(size=4,
-                                           color='#555555'),
+    # All stems in one trace, each segment broken off by None and given
+    # its own color through per-vertex line colors
+    fig.add_trace(go.Scatter3d(x=[val for xv in xvals for val in (0, xv, None)],
+                               y=[val for yv in yvals for val in (0, yv, None)],
+                               z=[val for zv in zvals for val in (0, zv, None)],
+                               mode="lines",
+                               hoverinfo=hover,
+                               opacity=0.5,
+                               line=dict(color=[col for col in colors for _ in range(3)],
+                                         width=3)
                                ),
-                  row=1, col=1)
-
-    for kk, _ in enumerate(xvals):
-        fig.add_trace(go.Scatter3d(x=[0, xvals[kk]], y=[0, yvals[kk]], z=[0, zvals[kk]],
-                                   mode="lines",
-                                   hoverinfo=None,
-                                   opacity=0.5,
-                                   line=dict(color=colors[kk], width=3)
-                                   ),
-                      row=1, col=1
-                      )
-
-        if state_labels:
-            xanc = 'center'
-            if xvals[kk] != 0:
-                if xvals[kk] < 0:
-                    xanc = 'right'
-                else:
-                    pass
-
-            yanc = 'middle'
-            if zvals[kk] != 0:
-                if zvals[kk] < 0:
-                    yanc = 'top'
-                else:
-                    yanc = 'bottom'
-
-            fig_annotations.append(dict(showarrow=False,
-                                        x=xvals[kk]*1.1,
-                                        y=yvals[kk]*1.1,
-                                        z=zvals[kk]*1.1,
-                                        text="<b>|{}\u3009</b>".format(bases[kk]),
-                                        align='left',
-                                        opacity=0.7,
-                                        xanchor=xanc,
-                                        yanchor=yanc,
-                                        xshift=10,
-                                        bgcolor="#ffffff",
-                                        font=dict(size=10,
-                                                  color="#000000",
-                                                  ),
-                                        )
-                                   )
+                  row=1, col=1
+                  )
 
-    fig.add_trace(go.Scatter3d(x=xvals, y=yvals, z=zvals,
+    # The sphere center shares the state markers' trace, its opacity in its color
+    fig.add_trace(go.Scatter3d(x=[0] + xvals, y=[0] + yvals, z=[0] + zvals,
                                mode='markers',
+                               hoverinfo=hover,
                                opacity=1,
-                               marker=dict(size=marker_sizes,
-                                           color=colors),
+                               marker=dict(size=[4] + marker_sizes,
+                                           color=['rgba(85,85,85,0.6)'] + colors),
                                ),
                   row=1, col=1)
 
-    slices = 128
-    labels = ['']*slices
-    values = [1]*slices
+    if state_labels:
+        # One text trace for all labels, placed away from the sphere center
+        xarr, zarr = np.asarray(xvals), np.asarray(zvals)
+        text_pos = [vpos + ' ' + hpos for vpos, hpos in
+                    zip(np.where(zarr < 0, 'bottom', np.where(zarr > 0, 'top', 'middle')),
+                        np.where(xarr < 0, 'left', 'center'))]
+        fig.add_trace(go.Scatter3d(x=(xarr*1.1).tolist(),
+                                   y=(np.asarray(yvals)*1.1).tolist(),
+                                   z=(zarr*1.1).tolist(),
+                                   mode='text',
+                                   text=[f"<b>|{base}\u3009</b>" for base in bases],
+                                   textposition=text_pos,
+                                   textfont=dict(size=10, color="#000000"),
+                                   opacity=0.7,
+                                   hoverinfo='skip',
+                                   ),
+                      row=1, col=1)
 
-    phase_colors = [mpl.colors.rgb2hex(cmap(norm(2*np.pi*kk/slices))) for kk in range(slices)]
+    labels = ['']*_PHASE_SLICES
+    values = [1]*_PHASE_SLICES
 
     fig.add_trace(go.Pie(labels=labels, values=values, hole=.6,
                          showlegend=False,
@@ -229,7 +208,7 @@ def qsphere(state, state_labels=True,
                          textposition="outside",
                          rotation=90,
                          textfont_size=12,
-                         marker=dict(colors=phase_colors)
+                         marker=dict(colors=_PHASE_COLORS)
                          ),
                   row=5, col=5)
 
@@ -301,8 +280,7 @@ def qsphere(state, state_labels=True,
                       showlegend=False,
                       scene_aspectmode='cube',
                       margin=dict(r=15, b=15, l=15, t=15),
-                      scene=dict(annotations=fig_annotations,
-                                 xaxis=dict(showbackground=False,
+                      scene=dict(xaxis=dict(showbackground=False,
                                             range=[-1.2, 1.2],
                                             showspikes=False,
                                             visible=False),
@@ -319,6 +297,11 @@ def qsphere(state, state_labels=True,
                                                  z=0.3)
                                         )
                       )
+    if dense:
+        fig.update_layout(hovermode=False,
+                          hoverdistance=0,
+                          spikedistance=0,
+                          scene_hovermode=False)
 
     if as_widget:
         return PlotlyWidget(fig)
@@ -326,73 +309,160 @@ def qsphere(state, state_labels=True,
     return PlotlyFigure(fig, modebar=True)
 
 
-def _lex_index(n, k, lst):
-    """Return  the lex index of a combination..
+def _purity(rho):
+    """Purity Tr(rho^2) of a density matrix.
 
-    Args:
-        n (int): the total number of options .
-        k (int): The number of elements.
-        lst (list): list
+    Evaluated as sum_ij rho_ij rho_ji, without forming the matrix product.
+
+    Parameters:
+        rho (ndarray): Density matrix.
 
     Returns:
-        int: returns int index for lex order
+        float: Real part of the purity.
+    """
+    return np.einsum('ij,ji->', rho, rho).real
 
-    Raises:
-        KaleidoscopeError: if length of list is not equal to k
+
+def _leading_eigvec(mat):
+    """Eigenvector of the largest eigenvalue of a Hermitian matrix.
+
+    Only the top eigenpair is computed, which for a pure density matrix
+    is the statevector up to a global phase.
+
+    Parameters:
+        mat (ndarray): Hermitian matrix.
+
+    Returns:
+        ndarray: Normalized eigenvector.
     """
-    if len(lst) != k:
-        raise KaleidoscopeError("list should have length k")
-    comb = list(map(lambda x: n - 1 - x, lst))
-    dualm = sum([spsp.comb(comb[k - 1 - i], i + 1) for i in range(k)])
-    return int(dualm)
+    dim = mat.shape[0]
+    _, evecs = la.eigh(mat, subset_by_index=[dim-1, dim-1])
+    return evecs[:, 0]
 
 
-def _bit_string_index(s):
-    """Return the index of a string of 0s and 1s.
+def _pascal_table(size):
+    """Table of binomial coefficients built with Pascal's rule.
 
     Parameters:
-        s (str): Bitstring.
+        size (int): Largest upper index in the table.
 
     Returns:
-        int: Index.
+        ndarray: Int64 array with ``table[n, k]`` equal to n choose k,
+        and zero for k > n.
+    """
+    table = np.zeros((size+1, size+2), dtype=np.int64)
+    table[:, 0] = 1
+    for n in range(1, size+1):
+        table[n, 1:] = table[n-1, 1:] + table[n-1, :-1]
+    return table
 
-    Raises:
-        KaleidoscopeError: If string is not binary.
+
+# Binomial coefficients for every supported number of qubits
+_BINOM = _pascal_table(63)
+
+
+@njit(parallel=True, cache=True)
+def _qsphere_geometry(idx, amps, num_qubits, binom):
+    """Positions and phases of basis states on the qsphere.
+
+    A state of Hamming weight ``w`` sits at height ``1 - 2w/n``, on a
+    latitude divided into ``C(n, w)`` slots.  Its slot is the lex index
+    of its set bits ``b_0 < b_1 < ...``, computed with the combinatorial
+    number system as ``sum_i C(b_i, i+1)``.  States past the equator are
+    reflected so that complementary states sit opposite each other.
+
+    Parameters:
+        idx (ndarray): Int64 basis-state indices.
+        amps (ndarray): Complex128 amplitudes of those states.
+        num_qubits (int): Number of qubits.
+        binom (ndarray): Int64 binomial table from ``_pascal_table``.
+
+    Returns:
+        tuple: x, y, and z coordinates, and phases in [0, 2pi).
+    """
+    num = idx.shape[0]
+    xvals = np.empty(num)
+    yvals = np.empty(num)
+    zvals = np.empty(num)
+    phases = np.empty(num)
+    for kk in prange(num):  # pylint: disable=not-an-iterable
+        val = idx[kk]
+        weight = 0
+        rank = 0
+        for pos in range(num_qubits):
+            if (val >> pos) & 1:
+                weight += 1
+                rank += binom[pos, weight]
+        zval = -2 * weight / num_qubits + 1
+        divisions = binom[num_qubits, weight]
+        angle = (weight / num_qubits) * (np.pi * 2) + (rank * 2 * (np.pi / divisions))
+        if weight > num_qubits / 2 or (weight == num_qubits / 2 and rank >= divisions / 2):
+            angle = np.pi - angle - (2 * np.pi / divisions)
+        radius = np.sqrt(1 - zval ** 2)
+        xvals[kk] = radius * np.cos(angle)
+        yvals[kk] = radius * np.sin(angle)
+        zvals[kk] = zval
+        phase = np.arctan2(amps[kk].imag, amps[kk].real)
+        phases[kk] = phase if phase >= 0 else phase + 2 * np.pi
+    return xvals, yvals, zvals, phases
+
+
+def _warm_kernels():
+    """Compiles (or loads from cache) the qsphere geometry kernel.
+
+    Uses the argument types of the call in ``qsphere`` so that the
+    warmed specialization is the one reused.  Compilation failures are
+    ignored here so that they surface at the real call site instead.
     """
-    n = len(s)
-    k = s.count("1")
-    if s.count("0") != n - k:
-        raise KaleidoscopeError("s must be a string of 0 and 1")
-    ones = [pos for pos, char in enumerate(s) if char == "1"]
-    return _lex_index(n, k, ones)
+    try:
+        _qsphere_geometry(np.zeros(1, dtype=np.intp), np.ones(1, dtype=np.complex128),
+                          1, _BINOM)
+    except Exception:  # pylint: disable=broad-except
+        pass
+
+
+if _PRECOMPILE:
+    _warm_kernels()
 
 
 def _qsphere_latitudes(zvals):
     """Latitude lines for sphere.
 
+    Each distinct z-value (and the equator) gets one circle, and circles
+    sharing a line style are merged into a single trace, separated by None.
+
     Parameters:
-        zvals (int): Input zvals
+        zvals (list): Heights of the drawn states, duplicates allowed.
 
     Returns:
         list: List of Plotly traces.
     """
-    lats = []
     u = np.linspace(0, 2*np.pi, 100)
+    cos_u, sin_u = np.cos(u), np.sin(u)
 
-    if 0 not in zvals:
-        zvals = [0] + zvals
-    for zv in zvals:
-        th = np.arctan2(np.sqrt(1 - zv ** 2), zv)
-        xvals = np.sin(th)*np.cos(u)
-        yvals = np.sin(th)*np.sin(u)
-        zvals = zv*np.ones_like(u)
+    unique_z = np.union1d(zvals, [0])
+    th = np.arctan2(np.sqrt(1 - unique_z ** 2), unique_z)
+    equator = th == np.pi/2
+
+    lats = []
+    for mask, color, width in ((equator, '#1e1e1e', 2), (~equator, '#373737', 1)):
+        if not mask.any():
+            continue
+        sin_th = np.sin(th[mask])[:, None]
+        z_grid = np.broadcast_to(unique_z[mask][:, None], (sin_th.shape[0], u.size))
+        coords = []
+        for vals in (sin_th*cos_u, sin_th*sin_u, z_grid):
+            # Trailing None column breaks the line between circles
+            padded = np.full((vals.shape[0], vals.shape[1]+1), None, dtype=object)
+            padded[:, :-1] = vals
+            coords.append(padded.ravel().tolist())
         lats.append(go.Scatter3d(
-            x=xvals, y=yvals, z=zvals,
+            x=coords[0], y=coords[1], z=coords[2],
             mode="lines",
             hoverinfo='skip',
             line=dict(
-                color='#1e1e1e' if th == np.pi/2 else '#373737',
-                width=2 if th == np.pi/2 else 1
+                color=color,
+                width=width
             )
         ))
     return lats
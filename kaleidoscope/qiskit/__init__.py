@@ -15,11 +15,32 @@
 
 """Qiskit specific functionality"""
 
-from kaleidoscope import HAS_QISKIT
+from typing import TYPE_CHECKING
+import kaleidoscope
 from kaleidoscope.errors import KaleidoscopeError
 
-if not HAS_QISKIT:
+if not kaleidoscope.HAS_QISKIT:
     raise KaleidoscopeError('Must install qiskit-terra, qiskit-aer, and qiskit-ibmq-provider.')
 
-from .backends.mpl import *
-from .backends.interactive import system_error_map, system_gate_map
+# The backends package defers loading its plotting routines until first
+# access, so `import kaleidoscope.qiskit` does not pull in matplotlib,
+# plotly, or scipy.  Attribute lookups are forwarded to it.
+from kaleidoscope.qiskit import backends
+
+if TYPE_CHECKING:
+    from .backends.mpl import *
+    from .backends.interactive import system_error_map, system_gate_map
+
+__all__ = list(backends.__all__)
+
+
+def __getattr__(name):
+    if name in backends.__all__:
+        val = getattr(backends, name)
+        globals()[name] = val
+        return val
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(backends.__all__))
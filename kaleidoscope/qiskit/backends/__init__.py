@@ -31,5 +31,28 @@ System visualizations
 
 """
 
-from .mpl.cnot_err import cnot_error_density
-from .interactive import system_error_map, system_gate_map
+import importlib
+from typing import TYPE_CHECKING
+
+# Each routine pulls in its own plotting stack, so import on first access.
+_LAZY = {'cnot_error_density': 'kaleidoscope.qiskit.backends.mpl.cnot_err',
+         'system_error_map': 'kaleidoscope.qiskit.backends.interactive.error_map',
+         'system_gate_map': 'kaleidoscope.qiskit.backends.interactive.gate_map'}
+
+if TYPE_CHECKING:
+    from .mpl.cnot_err import cnot_error_density
+    from .interactive import system_error_map, system_gate_map
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        val = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = val
+        return val
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -13,25 +13,82 @@
 # that they have been altered from the originals.
 # pylint: disable=broad-except, unspecified-encoding
 
-"""Device layout information."""
+"""Device layout information.
+
+Layouts are read from a local cache of the remote layouts file, or from the
+copy bundled with the package when there is no cache.  The cache is refreshed
+in a background thread with a conditional request, so importing never waits
+on the network; updated layouts are picked up on the next import.
+"""
 import os
 import json
+import tempfile
+import threading
 import requests
 
-# Try remote first since can be more up to date.
-LAYOUTS = None
-try:
-    _REMOTE_JSON_URL = "https://github.com/nonhermitian/ \
-                        ibm_quantum_system_layouts/raw/main/layouts.json"
-    _req = requests.get(_REMOTE_JSON_URL)
-    _req.raise_for_status()
-except Exception:
-    pass
-else:
-    LAYOUTS = _req.json()
-
-if LAYOUTS is None:
-    _LAYOUTS_DIR = os.path.dirname(os.path.realpath(__file__))
-    with open(_LAYOUTS_DIR+"/layouts.json", 'r') as f:
-        LAYOUTS = json.load(f)
-    f.close()
+_REMOTE_JSON_URL = ("https://github.com/nonhermitian/"
+                    "ibm_quantum_system_layouts/raw/main/layouts.json")
+
+_LAYOUTS_DIR = os.path.dirname(os.path.realpath(__file__))
+_CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME',
+                                         os.path.join(os.path.expanduser('~'), '.cache')),
+                          'kaleidoscope')
+_CACHE_FILE = os.path.join(_CACHE_DIR, 'layouts.json')
+_ETAG_FILE = _CACHE_FILE + '.etag'
+
+
+def _load_layouts():
+    """Loads the cached layouts, falling back to the bundled ones.
+
+    Returns:
+        dict: Device layouts.
+    """
+    try:
+        with open(_CACHE_FILE, 'r') as fd:
+            return json.load(fd)
+    except Exception:
+        pass
+    with open(os.path.join(_LAYOUTS_DIR, 'layouts.json'), 'r') as fd:
+        return json.load(fd)
+
+
+def _refresh_cache():
+    """Downloads the remote layouts into the cache if they have changed.
+
+    Any failure leaves the existing cache untouched.
+    """
+    headers = {}
+    if os.path.isfile(_CACHE_FILE):
+        try:
+            with open(_ETAG_FILE, 'r') as fd:
+                headers['If-None-Match'] = fd.read().strip()
+        except OSError:
+            pass
+    try:
+        req = requests.get(_REMOTE_JSON_URL, headers=headers, timeout=2)
+        if req.status_code == 304:
+            return
+        req.raise_for_status()
+        layouts = req.json()
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        # A unique temp file, so concurrent refreshes cannot interleave writes
+        tmp_fd, tmp_file = tempfile.mkstemp(dir=_CACHE_DIR, suffix='.tmp')
+        try:
+            with os.fdopen(tmp_fd, 'w') as fd:
+                json.dump(layouts, fd)
+            os.replace(tmp_file, _CACHE_FILE)
+        except Exception:
+            os.remove(tmp_file)
+            raise
+        etag = req.headers.get('ETag')
+        if etag:
+            with open(_ETAG_FILE, 'w') as fd:
+                fd.write(etag)
+        elif os.path.isfile(_ETAG_FILE):
+            os.remove(_ETAG_FILE)
+    except Exception:
+        pass
+
+
+LAYOUTS = _load_layouts()
+threading.Thread(target=_refresh_cache, daemon=True).start()
@@ -43,10 +43,17 @@ from kaleidoscope.errors import KaleidoscopeError
 from kaleidoscope.colors.utils import find_text_color
 from kaleidoscope.interactive.plotly_wrapper import PlotlyWidget, PlotlyFigure
 from kaleidoscope.qiskit.backends.device_layouts import LAYOUTS
-from kaleidoscope.qiskit.backends.pseudobackend import properties_to_pseudobackend
+from kaleidoscope.qiskit.backends.pseudobackend import PseudoBackend, properties_to_pseudobackend
+from kaleidoscope.qiskit.backends.interactive.utils import _coupling_segments
 from kaleidoscope.colors import BMW
 from kaleidoscope.colors.cmap import cmap_to_plotly
 
+# Devices with at least this many qubits are rendered with WebGL
+_WEBGL_QUBITS = 65
+
+# Extracted calibration data per device backend name, see _device_data
+_PROPS_CACHE = {}
+
 
 def system_error_map(backend,
                      figsize=(None, None),
@@ -91,32 +98,14 @@ def system_error_map(backend,
     if isinstance(backend, BackendProperties):
         backend = properties_to_pseudobackend(backend)
 
-    CMAP = BMW
-    PLOTLY_CMAP = cmap_to_plotly(CMAP)
-
-    if colormap is not None:
-        CMAP = colormap
-        PLOTLY_CMAP = cmap_to_plotly(CMAP)
-
-    meas_text_color = '#000000'
-    if background_color == 'white':
-        color_map = CMAP
-        text_color = '#000000'
-        plotly_cmap = PLOTLY_CMAP
-    elif background_color == 'black':
-        color_map = CMAP
-        text_color = '#FFFFFF'
-        plotly_cmap = PLOTLY_CMAP
-    else:
+    if background_color not in ('white', 'black'):
         raise KaleidoscopeError(
             '"{}" is not a valid background_color selection.'.format(background_color))
 
     if backend.configuration().simulator:
         raise KaleidoscopeError('Requires a device backend, not a simulator.')
 
-    config = backend.configuration()
-    n_qubits = config.n_qubits
-    cmap = config.coupling_map
+    n_qubits = backend.configuration().n_qubits
 
     if str(n_qubits) in LAYOUTS['layouts'].keys():
         kind = 'generic'
@@ -135,99 +124,81 @@ def system_error_map(backend,
         out = PlotlyWidget(fig)
         return out
 
-    props = backend.properties()
-
-    freqs = [0] * n_qubits
-    t1s = [0] * n_qubits
-    t2s = [0] * n_qubits
-    alphas = [0] * n_qubits
-    for idx, qubit_props in enumerate(props.qubits):
-        for item in qubit_props:
-            if item.name == 'frequency':
-                freqs[idx] = item.value
-            elif item.name == 'T1':
-                t1s[idx] = item.value
-            elif item.name == 'T2':
-                t2s[idx] = item.value
-            elif item.name == 'anharmonicity':
-                alphas[idx] = item.value
+    fig = _error_map_figure(backend, grid_data, figsize, colormap, background_color,
+                            show_title, remove_badcal_edges)
 
-    # U2 error rates
-    single_gate_errors = [0]*n_qubits
-    single_gate_times = [0]*n_qubits
-    for gate in props.gates:
-        if gate.gate in ['u2', 'sx']:
-            _qubit = gate.qubits[0]
-            for gpar in gate.parameters:
-                if gpar.name == 'gate_error':
-                    single_gate_errors[_qubit] = gpar.value
-                elif gpar.name == 'gate_length':
-                    single_gate_times[_qubit] = gpar.value
+    if as_widget:
+        return PlotlyWidget(fig)
+    return PlotlyFigure(fig)
+
+
+def _error_map_figure(backend, grid_data, figsize, colormap, background_color,
+                      show_title, remove_badcal_edges):
+    """Builds the error map figure of a device.
+
+    Parameters:
+        backend (IBMQBackend or FakeBackend or PseudoBackend): A device backend.
+        grid_data (list): Qubit coordinates of the device layout.
+        figsize (tuple): Figure size in pixels.
+        colormap (Colormap): A matplotlib colormap, or ``None`` for the default.
+        background_color (str): Background color, either 'white' or 'black'.
+        show_title (bool): Whether to show figure title.
+        remove_badcal_edges (bool): Whether to remove bad CX gate calibration data.
+
+    Returns:
+        Figure: The error map figure.
+    """
+    color_map = BMW if colormap is None else colormap
+    plotly_cmap = cmap_to_plotly(color_map)
+
+    meas_text_color = '#000000'
+    text_color = '#000000' if background_color == 'white' else '#FFFFFF'
+
+    config = backend.configuration()
+    n_qubits = config.n_qubits
+    cmap = config.coupling_map
+
+    (freqs, t1s, t2s, alphas, single_gate_errors, single_gate_times,
+     cx_errors, cx_times, read_err, p01_err, p10_err) = _device_data(backend, n_qubits, cmap)
 
     # Convert to log10
-    single_gate_errors = np.log10(np.asarray(single_gate_errors))
+    single_gate_errors = np.log10(single_gate_errors)
 
-    avg_1q_err = np.mean(single_gate_errors)
-    max_1q_err = _round_log10_exp(np.max(single_gate_errors), rnd='up', decimals=1)
-    min_1q_err = _round_log10_exp(np.min(single_gate_errors), rnd='down', decimals=1)
+    avg_1q_err = single_gate_errors.mean()
+    max_1q_err = _round_log10_exp(single_gate_errors.max(), rnd='up', decimals=1)
+    min_1q_err = _round_log10_exp(single_gate_errors.min(), rnd='down', decimals=1)
 
     single_norm = mpl.colors.Normalize(vmin=min_1q_err, vmax=max_1q_err)
 
-    q_colors = [mpl.colors.rgb2hex(color_map(single_norm(err))) for err in single_gate_errors]
+    q_colors = _hex_colors(color_map(single_norm(single_gate_errors)))
 
     if n_qubits > 1:
         line_colors = []
         if cmap:
-            cx_errors = []
-            cx_times = []
-            for line in cmap:
-                for gate in props.gates:
-                    if gate.qubits == line:
-                        for gpar in gate.parameters:
-                            if gpar.name == 'gate_error':
-                                cx_errors.append(gpar.value)
-                            elif gpar.name == 'gate_length':
-                                cx_times.append(gpar.value)
-
-            # Convert to array
-            cx_errors = np.log10(np.asarray(cx_errors))
+            # Convert to log10
+            cx_errors = np.log10(cx_errors)
 
             # remove bad cx edges
             if remove_badcal_edges:
-                cx_idx = np.where(cx_errors != 0.0)[0]
+                good_cx_errors = cx_errors[cx_errors != 0.0]
             else:
-                cx_idx = np.arange(len(cx_errors))
+                good_cx_errors = cx_errors
 
-            avg_cx_err = np.mean(cx_errors[cx_idx])
-            min_cx_err = _round_log10_exp(np.min(cx_errors[cx_idx]), rnd='down', decimals=1)
-            max_cx_err = _round_log10_exp(np.max(cx_errors[cx_idx]), rnd='up', decimals=1)
+            avg_cx_err = good_cx_errors.mean()
+            min_cx_err = _round_log10_exp(good_cx_errors.min(), rnd='down', decimals=1)
+            max_cx_err = _round_log10_exp(good_cx_errors.max(), rnd='up', decimals=1)
 
             cx_norm = mpl.colors.Normalize(vmin=min_cx_err, vmax=max_cx_err)
 
-            for err in cx_errors:
-                if err != 0.0 or not remove_badcal_edges:
-                    line_colors.append(mpl.colors.rgb2hex(color_map(cx_norm(err))))
-                else:
-                    line_colors.append("#ff0000")
+            line_colors = _hex_colors(color_map(cx_norm(cx_errors)))
+            if remove_badcal_edges:
+                line_colors = np.where(cx_errors == 0.0, "#ff0000", line_colors).tolist()
 
     # Measurement errors
-    read_err = [0] * n_qubits
-    p01_err = [0] * n_qubits
-    p10_err = [0] * n_qubits
-    for qubit in range(n_qubits):
-        for item in props.qubits[qubit]:
-            if item.name == 'readout_error':
-                read_err[qubit] = item.value
-            elif item.name == 'prob_meas0_prep1':
-                p01_err[qubit] = item.value
-            elif item.name == 'prob_meas1_prep0':
-                p10_err[qubit] = item.value
-
-    read_err = np.asarray(read_err)
-    avg_read_err = np.mean(read_err)
-    max_read_err = np.max(read_err)
-    p01_err = np.asarray(p01_err)
-    p10_err = np.asarray(p10_err)
+    avg_read_err = read_err.mean()
+    max_read_err = read_err.max()
+    # Rounded readout axis ticks
+    avg_read_tick, max_read_tick = np.round([avg_read_err, max_read_err], 2).tolist()
 
     if n_qubits < 10:
         num_left = n_qubits
@@ -236,8 +207,7 @@ def system_error_map(backend,
         num_left = math.ceil(n_qubits / 2)
         num_right = n_qubits - num_left
 
-    x_max = max([d[1] for d in grid_data])
-    y_max = max([d[0] for d in grid_data])
+    y_max, x_max = np.max(grid_data, axis=0).tolist()
     max_dim = max(x_max, y_max)
 
     qubit_size = 32
@@ -276,80 +246,48 @@ def system_error_map(backend,
                                         cx_title)
                         )
 
-    # Add lines for couplings
-    if cmap and n_qubits > 1:
-        for ind, edge in enumerate(cmap):
-            is_symmetric = False
-            if edge[::-1] in cmap:
-                is_symmetric = True
-            y_start = grid_data[edge[0]][0] + offset
-            x_start = grid_data[edge[0]][1]
-            y_end = grid_data[edge[1]][0] + offset
-            x_end = grid_data[edge[1]][1]
-
-            if is_symmetric:
-                if y_start == y_end:
-                    x_end = (x_end - x_start) / 2 + x_start
-                    x_mid = x_end
-                    y_mid = y_start
-
-                elif x_start == x_end:
-                    y_end = (y_end - y_start) / 2 + y_start
-                    x_mid = x_start
-                    y_mid = y_end
-
-                else:
-                    x_end = (x_end - x_start) / 2 + x_start
-                    y_end = (y_end - y_start) / 2 + y_start
-                    x_mid = x_end
-                    y_mid = y_end
-            else:
-                if y_start == y_end:
-                    x_mid = (x_end - x_start) / 2 + x_start
-                    y_mid = y_end
+    # Large devices draw the coupling map with WebGL; small ones stay SVG so
+    # that notebooks with many figures do not run out of WebGL contexts.
+    scatter = go.Scattergl if n_qubits >= _WEBGL_QUBITS else go.Scatter
 
-                elif x_start == x_end:
-                    x_mid = x_end
-                    y_mid = (y_end - y_start) / 2 + y_start
-
-                else:
-                    x_mid = (x_end - x_start) / 2 + x_start
-                    y_mid = (y_end - y_start) / 2 + y_start
-
-            cx_str = 'cnot<sub>err</sub> = {err}'
-            cx_str += '<br>&#120591;<sub>cx</sub>     = {tau} ns'
+    # Add lines for couplings, one trace per line color with the
+    # segments of each edge separated by None
+    if cmap and n_qubits > 1:
+        edge_lines = _coupling_segments(cmap, grid_data, offset, line_colors)
+        cx_times_r = [np.round(tau, 2) for tau in cx_times]
+        edge_texts = [f"cnot<sub>err</sub> = {_pow10_text(cx_errors[ind])}"
+                      f"<br>&#120591;<sub>cx</sub>     = {cx_times_r[ind]} ns"
+                      for ind in range(len(cmap))]
+
+        for color, (xvals, yvals, indices) in edge_lines.items():
+            texts = []
+            for ind in indices:
+                texts.extend([edge_texts[ind]] * 3 + [None])
             fig.append_trace(
-                go.Scatter(x=[x_start, x_mid, x_end],
-                           y=[-y_start, -y_mid, -y_end],
-                           mode="lines",
-                           line=dict(width=6,
-                                     color=line_colors[ind]),
-                           hoverinfo='text',
-                           hovertext=cx_str.format(
-                               err='{:.3}\u22C510<sup>{}</sup>'.format(
-                                   *_pow10_coeffs(cx_errors[ind])),
-                               tau=np.round(cx_times[ind], 2))
-                           ),
+                scatter(x=xvals,
+                        y=yvals,
+                        mode="lines",
+                        line=dict(width=6,
+                                  color=color),
+                        hoverinfo='text',
+                        hovertext=texts
+                        ),
                 row=1, col=3)
 
     # Add the qubits themselves
-    qubit_text = []
-    qubit_str = "<b>Qubit {idx}</b>"
-    qubit_str += "<br>freq = {freq} GHz"
-    qubit_str += "<br>T<sub>1</sub>   = {t1} \u03BCs"
-    qubit_str += "<br>T<sub>2</sub>   = {t2} \u03BCs"
-    qubit_str += "<br>&#945;    = {anh} GHz"
-    qubit_str += "<br>sx<sub>err</sub> = {err}"
-    qubit_str += "<br>&#120591;<sub>sx</sub>   = {tau} ns"
-    for kk in range(n_qubits):
-        qubit_text.append(qubit_str.format(idx=kk,
-                                           freq=np.round(freqs[kk], 5),
-                                           t1=np.round(t1s[kk], 2),
-                                           t2=np.round(t2s[kk], 2),
-                                           anh=np.round(alphas[kk], 3) if alphas[kk] else 'NA',
-                                           err='{:.3}\u22C510<sup>{}</sup>'.format(
-                                               *_pow10_coeffs(single_gate_errors[kk])),
-                                           tau=np.round(single_gate_times[kk], 2)))
+    freqs_r = np.round(freqs, 5).tolist()
+    t1s_r = np.round(t1s, 2).tolist()
+    t2s_r = np.round(t2s, 2).tolist()
+    alphas_r = np.round(alphas, 3).tolist()
+    single_gate_times_r = [np.round(tau, 2) for tau in single_gate_times]
+    qubit_text = [f"<b>Qubit {kk}</b>"
+                  f"<br>freq = {freqs_r[kk]} GHz"
+                  f"<br>T<sub>1</sub>   = {t1s_r[kk]} \u03BCs"
+                  f"<br>T<sub>2</sub>   = {t2s_r[kk]} \u03BCs"
+                  f"<br>&#945;    = {alphas_r[kk] if alphas[kk] else 'NA'} GHz"
+                  f"<br>sx<sub>err</sub> = {_pow10_text(single_gate_errors[kk])}"
+                  f"<br>&#120591;<sub>sx</sub>   = {single_gate_times_r[kk]} ns"
+                  for kk in range(n_qubits)]
 
     if n_qubits > 20:
         qubit_size = 23
@@ -363,19 +301,49 @@ def system_error_map(backend,
     for ii in range(n_qubits):
         qtext_color.append(find_text_color(q_colors[ii]))
 
-    fig.append_trace(go.Scatter(
+    # The qubit markers carry the SX error rate colorbar
+    if n_qubits > 1:
+        mid_1q_err = _round_log10_exp((max_1q_err-min_1q_err)/2+min_1q_err,
+                                      rnd='up', decimals=1)
+        qubit_marker = dict(color=single_gate_errors,
+                            cmin=min_1q_err, cmax=max_1q_err,
+                            colorscale=plotly_cmap,
+                            showscale=True,
+                            colorbar=_colorbar(fig, 2, 1, [min_1q_err, mid_1q_err, max_1q_err]))
+    else:
+        qubit_marker = dict(color=q_colors)
+
+    fig.append_trace(scatter(
         x=[d[1] for d in grid_data],
         y=[-d[0]-offset for d in grid_data],
         mode="markers+text",
-        marker=go.scatter.Marker(size=qubit_size,
-                                 color=q_colors,
-                                 opacity=1),
+        marker=dict(size=qubit_size,
+                    opacity=1,
+                    **qubit_marker),
         text=[str(ii) for ii in range(n_qubits)],
         textposition="middle center",
         textfont=dict(size=font_size, color=qtext_color),
         hoverinfo="text",
         hovertext=qubit_text), row=1, col=3)
 
+    # Lines cannot carry a colorscale, so the CX error rate colorbar
+    # hangs off a single marker that is never drawn
+    if cmap and n_qubits > 1:
+        mid_cx_err = (max_cx_err-min_cx_err)/2 + min_cx_err
+        fig.append_trace(scatter(
+            x=[None], y=[None],
+            mode="markers",
+            marker=dict(color=[min_cx_err],
+                        cmin=min_cx_err, cmax=max_cx_err,
+                        colorscale=plotly_cmap,
+                        showscale=True,
+                        colorbar=_colorbar(fig, 2, 7, [min_cx_err, mid_cx_err, max_cx_err])),
+            hoverinfo="skip"), row=1, col=3)
+
+    # The bottom row only holds colorbars and their titles
+    fig.update_xaxes(row=2, visible=False)
+    fig.update_yaxes(row=2, visible=False)
+
     fig.update_xaxes(row=1, col=3, visible=False)
     _range = None
     if offset:
@@ -385,76 +353,24 @@ def system_error_map(backend,
                      visible=False,
                      range=_range)
 
-    # H error rate colorbar
-    if n_qubits > 1:
-        fig.append_trace(go.Heatmap(z=[np.linspace(min_1q_err,
-                                                   max_1q_err, 100),
-                                       np.linspace(min_1q_err,
-                                                   max_1q_err, 100)],
-                                    colorscale=plotly_cmap,
-                                    showscale=False,
-                                    hoverinfo='none'), row=2, col=1)
-
-        fig.update_yaxes(row=2,
-                         col=1,
-                         visible=False)
+    read_err_r = np.round(read_err, 4).tolist()
+    p01_err_r = np.round(p01_err, 4).tolist()
+    p10_err_r = np.round(p10_err, 4).tolist()
+    meas_text = [f"<b>Qubit {kk}</b>"
+                 f"<br>M<sub>err</sub> = {read_err_r[kk]}"
+                 f"<br>P<sub>0|1</sub> = {p01_err_r[kk]}"
+                 f"<br>P<sub>1|0</sub> = {p10_err_r[kk]}"
+                 for kk in range(n_qubits)]
 
-        mid_1q_err = _round_log10_exp((max_1q_err-min_1q_err)/2+min_1q_err,
-                                      rnd='up', decimals=1)
-
-        fig.update_xaxes(row=2,
-                         col=1,
-                         tickfont=dict(size=13),
-                         tickvals=[0, 49, 99],
-                         ticktext=['{:.2}\u22C510<sup>{}</sup>'.format(
-                             *_pow10_coeffs(min_1q_err)),
-                                   '{:.2}\u22C510<sup>{}</sup>'.format(
-                                       *_pow10_coeffs(mid_1q_err)),
-                                   '{:.2}\u22C510<sup>{}</sup>'.format(
-                                       *_pow10_coeffs(max_1q_err)),
-                                   ])
-
-    # CX error rate colorbar
-    if cmap and n_qubits > 1:
-        fig.append_trace(go.Heatmap(z=[np.linspace(min_cx_err,
-                                                   max_cx_err, 100),
-                                       np.linspace(min_cx_err,
-                                                   max_cx_err, 100)],
-                                    colorscale=plotly_cmap,
-                                    showscale=False,
-                                    hoverinfo='none'), row=2, col=7)
-
-        fig.update_yaxes(row=2, col=7, visible=False)
-
-        mid_cx_err = (max_cx_err-min_cx_err)/2 + min_cx_err
-        fig.update_xaxes(row=2, col=7,
-                         tickfont=dict(size=13),
-                         tickvals=[0, 49, 99],
-                         ticktext=['{:.2}\u22C510<sup>{}</sup>'.format(
-                             *_pow10_coeffs(min_cx_err)),
-                                   '{:.2}\u22C510<sup>{}</sup>'.format(
-                                       *_pow10_coeffs(mid_cx_err)),
-                                   '{:.2}\u22C510<sup>{}</sup>'.format(
-                                       *_pow10_coeffs(max_cx_err))])
-
-    hover_text = "<b>Qubit {idx}</b>"
-    hover_text += "<br>M<sub>err</sub> = {err}"
-    hover_text += "<br>P<sub>0|1</sub> = {p01}"
-    hover_text += "<br>P<sub>1|0</sub> = {p10}"
     # Add the left side meas errors
-    for kk in range(num_left-1, -1, -1):
-        fig.append_trace(go.Bar(x=[read_err[kk]], y=[kk],
-                                orientation='h',
-                                marker=dict(color='#c7c7c5'),
-                                hoverinfo="text",
-                                hoverlabel=dict(font=dict(color=meas_text_color)),
-                                hovertext=[hover_text.format(idx=kk,
-                                                             err=np.round(read_err[kk], 4),
-                                                             p01=np.round(p01_err[kk], 4),
-                                                             p10=np.round(p10_err[kk], 4)
-                                                             )]
-                                ),
-                         row=1, col=1)
+    fig.append_trace(go.Bar(x=read_err[:num_left], y=list(range(num_left)),
+                            orientation='h',
+                            marker=dict(color='#c7c7c5'),
+                            hoverinfo="text",
+                            hoverlabel=dict(font=dict(color=meas_text_color)),
+                            hovertext=meas_text[:num_left]
+                            ),
+                     row=1, col=1)
 
     fig.append_trace(go.Scatter(x=[avg_read_err, avg_read_err],
                                 y=[-0.25, num_left-1+0.25],
@@ -470,8 +386,7 @@ def system_error_map(backend,
 
     fig.update_xaxes(row=1, col=1,
                      range=[0, 1.1*max_read_err],
-                     tickvals=[0, np.round(avg_read_err, 2),
-                               np.round(max_read_err, 2)],
+                     tickvals=[0, avg_read_tick, max_read_tick],
                      showline=True, linewidth=1, linecolor=text_color,
                      tickcolor=text_color,
                      ticks="outside",
@@ -480,21 +395,15 @@ def system_error_map(backend,
 
     # Add the right side meas errors, if any
     if num_right:
-        for kk in range(n_qubits-1, num_left-1, -1):
-            fig.append_trace(go.Bar(x=[-read_err[kk]],
-                                    y=[kk],
-                                    orientation='h',
-                                    marker=dict(color='#c7c7c5'),
-                                    hoverinfo="text",
-                                    hoverlabel=dict(font=dict(color=meas_text_color)),
-                                    hovertext=[hover_text.format(idx=kk,
-                                                                 err=np.round(read_err[kk], 4),
-                                                                 p01=np.round(p01_err[kk], 4),
-                                                                 p10=np.round(p10_err[kk], 4)
-                                                                 )
-                                               ]
-                                    ),
-                             row=1, col=9)
+        fig.append_trace(go.Bar(x=-read_err[num_left:],
+                                y=list(range(num_left, n_qubits)),
+                                orientation='h',
+                                marker=dict(color='#c7c7c5'),
+                                hoverinfo="text",
+                                hoverlabel=dict(font=dict(color=meas_text_color)),
+                                hovertext=meas_text[num_left:]
+                                ),
+                         row=1, col=9)
 
         fig.append_trace(go.Scatter(x=[-avg_read_err, -avg_read_err],
                                     y=[num_left-0.25, n_qubits-1+0.25],
@@ -515,8 +424,8 @@ def system_error_map(backend,
         fig.update_xaxes(row=1,
                          col=9,
                          range=[-1.1*max_read_err, 0],
-                         tickvals=[0, -np.round(avg_read_err, 2), -np.round(max_read_err, 2)],
-                         ticktext=[0, np.round(avg_read_err, 2), np.round(max_read_err, 2)],
+                         tickvals=[0, -avg_read_tick, -max_read_tick],
+                         ticktext=[0, avg_read_tick, max_read_tick],
                          showline=True, linewidth=1, linecolor=text_color,
                          tickcolor=text_color,
                          ticks="outside",
@@ -541,9 +450,158 @@ def system_error_map(backend,
                                       align='left'
                                       )
                       )
-    if as_widget:
-        return PlotlyWidget(fig)
-    return PlotlyFigure(fig)
+    return fig
+
+
+def _colorbar(fig, row, col, tickvals):
+    """Builds a horizontal colorbar filling a subplot cell.
+
+    Parameters:
+        fig (Figure): Figure made with ``make_subplots``.
+        row (int): Row of the cell.
+        col (int): Column of the cell.
+        tickvals (list): Tick values in log10.
+
+    Returns:
+        dict: Colorbar properties.
+    """
+    cell = fig.get_subplot(row, col)
+    x_dom = cell.xaxis.domain
+    y_dom = cell.yaxis.domain
+    return dict(orientation='h',
+                x=x_dom[0], xanchor='left', xpad=0,
+                y=y_dom[0], yanchor='bottom', ypad=0,
+                len=x_dom[1]-x_dom[0], lenmode='fraction',
+                thickness=y_dom[1]-y_dom[0], thicknessmode='fraction',
+                outlinewidth=0,
+                tickfont=dict(size=13),
+                tickvals=tickvals,
+                ticktext=['{:.2}\u22C510<sup>{}</sup>'.format(*_pow10_coeffs(val))
+                          for val in tickvals])
+
+
+def _hex_colors(rgba):
+    """Converts colormap output to hex color strings.
+
+    Rounds like ``matplotlib.colors.rgb2hex``, but for all rows at once.
+
+    Parameters:
+        rgba (ndarray): An (N, 4) array of RGBA values in [0, 1].
+
+    Returns:
+        list: Hex color strings, one per row.
+    """
+    rgb = np.round(np.asarray(rgba)[:, :3] * 255).astype(int)
+    return ['#%02x%02x%02x' % tuple(row) for row in rgb.tolist()]
+
+
+def _device_data(backend, n_qubits, cmap):
+    """Extracts the calibration data plotted in the error map.
+
+    Results for device backends are cached per backend name and reused
+    for as long as the backend reports the same calibration values, so
+    redrawing the map of an unchanged device skips extracting them.  The
+    check compares the values themselves, so properties edited in place
+    are picked up.  Properties passed in directly are never cached.
+
+    Parameters:
+        backend (IBMQBackend or FakeBackend or PseudoBackend): A device backend.
+        n_qubits (int): Number of qubits.
+        cmap (list): Coupling map of the device.
+
+    Returns:
+        tuple: Qubit frequencies, T1s, T2s, anharmonicities, single-qubit gate
+        errors and lengths, CX gate errors and lengths, and readout, P(0|1)
+        and P(1|0) errors.  Gate lengths are tuples of the reported values,
+        the rest read-only arrays.
+    """
+    backend_name = backend.name()
+    values = _props_values(backend.properties())
+    use_cache = not isinstance(backend, PseudoBackend)
+    if use_cache:
+        cache_key = (n_qubits, tuple(tuple(edge) for edge in cmap or ()), values)
+        cached = _PROPS_CACHE.get(backend_name)
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+    qubit_map, gate_map = _index_props(values)
+
+    qubit_keys = ('frequency', 'T1', 'T2', 'anharmonicity',
+                  'readout_error', 'prob_meas0_prep1', 'prob_meas1_prep0')
+    qubit_data = np.zeros((len(qubit_keys), n_qubits))
+    for idx, qubit_props in enumerate(qubit_map):
+        for row, key in enumerate(qubit_keys):
+            qubit_data[row, idx] = qubit_props.get(key, 0)
+    freqs, t1s, t2s, alphas, read_err, p01_err, p10_err = qubit_data
+
+    # U2 error rates
+    single_gate_errors = np.zeros(n_qubits)
+    # Gate lengths are only displayed, so keep them as reported (int or float)
+    single_gate_times = [0] * n_qubits
+    for _qubit in range(n_qubits):
+        for name, gate_params in gate_map.get((_qubit,), []):
+            if name in ['u2', 'sx']:
+                if 'gate_error' in gate_params:
+                    single_gate_errors[_qubit] = gate_params['gate_error']
+                if 'gate_length' in gate_params:
+                    single_gate_times[_qubit] = gate_params['gate_length']
+
+    num_edges = len(cmap) if cmap and n_qubits > 1 else 0
+    cx_errors = np.zeros(num_edges)
+    cx_times = [0] * num_edges
+    for ind in range(num_edges):
+        for _, gate_params in gate_map.get(tuple(cmap[ind]), []):
+            if 'gate_error' in gate_params:
+                cx_errors[ind] = gate_params['gate_error']
+            if 'gate_length' in gate_params:
+                cx_times[ind] = gate_params['gate_length']
+
+    # Cached arrays are shared between calls
+    for vals in (freqs, t1s, t2s, alphas, single_gate_errors, cx_errors,
+                 read_err, p01_err, p10_err):
+        vals.flags.writeable = False
+    data = (freqs, t1s, t2s, alphas, single_gate_errors, tuple(single_gate_times),
+            cx_errors, tuple(cx_times), read_err, p01_err, p10_err)
+    if use_cache:
+        _PROPS_CACHE[backend_name] = (cache_key, data)
+    return data
+
+
+def _props_values(props):
+    """Snapshot of the backend property values plotted in the error map.
+
+    Parameters:
+        props (BackendProperties): Backend properties.
+
+    Returns:
+        tuple: Per-qubit tuples of ``(name, value)`` pairs, and per-gate
+        ``(qubits, gate name, ((name, value), ...))`` tuples.
+    """
+    qubit_values = tuple(tuple((item.name, item.value) for item in qubit_props)
+                         for qubit_props in props.qubits)
+    gate_values = tuple((tuple(gate.qubits), gate.gate,
+                         tuple((gpar.name, gpar.value) for gpar in gate.parameters))
+                        for gate in props.gates)
+    return qubit_values, gate_values
+
+
+def _index_props(values):
+    """Indexes backend property values for direct lookup.
+
+    Parameters:
+        values (tuple): Property values as returned by ``_props_values``.
+
+    Returns:
+        tuple: A list with a ``{name: value}`` dict per qubit, and a dict
+        mapping each tuple of gate qubits to a list of
+        ``(gate name, {parameter name: value})`` pairs, in property order.
+    """
+    qubit_values, gate_values = values
+    qubit_map = [dict(qubit_items) for qubit_items in qubit_values]
+    gate_map = {}
+    for qubits, gate_name, gate_items in gate_values:
+        gate_map.setdefault(qubits, []).append((gate_name, dict(gate_items)))
+    return qubit_map, gate_map
 
 
 def _round_up(n, decimals=0):
@@ -572,6 +630,19 @@ def _pow10_coeffs(x):
     return (10**x)*10**y, int(-y)
 
 
+def _pow10_text(x):
+    """Formats a log10 number as HTML in the form A*10**y.
+
+    Parameters:
+        x (float): Input number in log10.
+
+    Returns:
+        str: The number with a three digit coefficient.
+    """
+    coeff, exp = _pow10_coeffs(x)
+    return f"{coeff:.3}\u22C510<sup>{exp}</sup>"
+
+
 def _round_log10_exp(x, rnd='up', decimals=1):
     """Rounds a log10 number to the nearest value
     such that it can be cleanly written as A*10**y
@@ -34,6 +34,7 @@ from kaleidoscope.errors import KaleidoscopeError
 from kaleidoscope.qiskit.backends.pseudobackend import properties_to_pseudobackend
 from kaleidoscope.interactive.plotly_wrapper import PlotlyWidget, PlotlyFigure
 from kaleidoscope.qiskit.backends.device_layouts import LAYOUTS
+from kaleidoscope.qiskit.backends.interactive.utils import _coupling_segments
 
 
 def system_gate_map(
@@ -156,53 +157,18 @@ def system_gate_map(
 
     fig = go.Figure()
 
-    # Add lines for couplings
+    # Add lines for couplings, one trace per line color with the
+    # segments of each edge separated by None
     if cmap:
-        for ind, edge in enumerate(cmap):
-            is_symmetric = False
-            if edge[::-1] in cmap:
-                is_symmetric = True
-            y_start = grid_data[edge[0]][0] + offset
-            x_start = grid_data[edge[0]][1]
-            y_end = grid_data[edge[1]][0] + offset
-            x_end = grid_data[edge[1]][1]
-
-            if is_symmetric:
-                if y_start == y_end:
-                    x_end = (x_end - x_start) / 2 + x_start
-                    x_mid = x_end
-                    y_mid = y_start
-
-                elif x_start == x_end:
-                    y_end = (y_end - y_start) / 2 + y_start
-                    x_mid = x_start
-                    y_mid = y_end
-
-                else:
-                    x_end = (x_end - x_start) / 2 + x_start
-                    y_end = (y_end - y_start) / 2 + y_start
-                    x_mid = x_end
-                    y_mid = y_end
-            else:
-                if y_start == y_end:
-                    x_mid = (x_end - x_start) / 2 + x_start
-                    y_mid = y_end
-
-                elif x_start == x_end:
-                    x_mid = x_end
-                    y_mid = (y_end - y_start) / 2 + y_start
-
-                else:
-                    x_mid = (x_end - x_start) / 2 + x_start
-                    y_mid = (y_end - y_start) / 2 + y_start
-
+        edge_lines = _coupling_segments(cmap, grid_data, offset, line_colors)
+        for color, (xvals, yvals, _) in edge_lines.items():
             fig.add_trace(
-                go.Scatter(x=[x_start, x_mid, x_end],
-                           y=[-y_start, -y_mid, -y_end],
+                go.Scatter(x=xvals,
+                           y=yvals,
                            mode="lines",
                            hoverinfo='none',
                            line=dict(width=line_width,
-                                     color=line_colors[ind])))
+                                     color=color)))
 
     # Add the qubits themselves
     qubit_text = []
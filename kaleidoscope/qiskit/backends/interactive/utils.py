@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Kaleidoscope.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Interactive backend utility functions"""
+
+import numpy as np
+
+
+def _coupling_segments(cmap, grid_data, offset, line_colors):
+    """Line segments of a coupling map grouped by line color.
+
+    Each edge is drawn from its start qubit through the midpoint to its
+    end qubit, or only up to the midpoint when the reverse edge draws
+    the other half.  Edges of one color are separated by ``None`` so
+    they can go into a single trace.
+
+    Parameters:
+        cmap (list): Coupling map edges as pairs of qubit indices.
+        grid_data (list): Grid (row, column) position of each qubit.
+        offset (int): Row offset added to every qubit position.
+        line_colors (list): Color of each edge.
+
+    Returns:
+        dict: Maps each color to ``(xvals, yvals, edge_indices)``, where
+        ``edge_indices`` are the cmap indices of the edges in draw order.
+    """
+    edge_lines = {}
+    edges = np.asarray(cmap)
+    coords = np.asarray(grid_data, dtype=float) + [offset, 0]
+    starts = coords[edges[:, 0]]
+    ends = coords[edges[:, 1]]
+    # Rounded so float residue cannot reach plotly as e.g. 1e-13
+    mids = np.round((ends - starts) / 2 + starts, 5)
+    cmap_set = {tuple(edge) for edge in cmap}
+    symmetric = np.array([(edge[1], edge[0]) in cmap_set for edge in cmap])
+    ends[symmetric] = mids[symmetric]
+    for ind, (start, mid, end) in enumerate(zip(starts.tolist(),
+                                                mids.tolist(),
+                                                ends.tolist())):
+        xvals, yvals, indices = edge_lines.setdefault(line_colors[ind], ([], [], []))
+        xvals.extend([start[1], mid[1], end[1], None])
+        yvals.extend([-start[0], -mid[0], -end[0], None])
+        indices.append(ind)
+    return edge_lines
@@ -15,15 +15,16 @@
 
 """CNOT error density plot"""
 
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from scipy.stats import gaussian_kde
-import matplotlib as mpl
-import matplotlib.pyplot as plt
 from qiskit.providers.models.backendproperties import BackendProperties
 from kaleidoscope.colors import COLORS1, COLORS2, COLORS3, COLORS4, COLORS5, COLORS14
 from kaleidoscope.errors import KaleidoscopeError
 from kaleidoscope.qiskit.backends.pseudobackend import properties_to_pseudobackend
 
+_PALETTES = {1: COLORS1, 2: COLORS2, 3: COLORS3, 4: COLORS4, 5: COLORS5}
+
 
 def cnot_error_density(backends,
                        figsize=None,
@@ -33,7 +34,8 @@ def cnot_error_density(backends,
                        covariance_factor=0.1,
                        xlim=None,
                        text_xval=None,
-                       xticks=None):
+                       xticks=None,
+                       use_pyplot=True):
     """Plot CNOT error distribution for one or more IBMQ backends.
 
     Parameters:
@@ -47,6 +49,9 @@ def cnot_error_density(backends,
         xlim (list or tuple): Optional lower and upper limits of cnot error values.
         text_xval (float): Optional xaxis value at which to start the backend text.
         xticks (list): Optional list of xaxis ticks to plot.
+        use_pyplot (bool): Create the figure through pyplot, so that ``plt.show()`` and
+                           interactive backends display it.  If ``False``, the figure is
+                           rendered on a bare Agg canvas and never registered with pyplot.
 
     Returns:
         Figure: A matplotlib Figure instance.
@@ -70,6 +75,9 @@ def cnot_error_density(backends,
 
             cnot_error_density(backends)
     """
+    # Deferred so that importing the backends package does not load matplotlib
+    import matplotlib as mpl
+    from matplotlib.collections import PolyCollection
 
     if not isinstance(backends, list):
         backends = [backends]
@@ -78,8 +86,13 @@ def cnot_error_density(backends,
         if isinstance(back, BackendProperties):
             backends[idx] = properties_to_pseudobackend(back)
 
-    for back in backends:
-        if back.configuration().n_qubits < 2:
+    # configuration() and properties() may rebuild their objects or hit the
+    # network on every call, so fetch each once per backend, concurrently
+    with ThreadPoolExecutor(max_workers=min(16, len(backends))) as executor:
+        meta = list(executor.map(_backend_meta, backends))
+
+    for config, _ in meta:
+        if config.n_qubits < 2:
             raise KaleidoscopeError('Number of backend qubits must be > 1')
 
     if scale not in ['linear', 'log']:
@@ -88,51 +101,36 @@ def cnot_error_density(backends,
     # Attempt to autosize if figsize=None
     if figsize is None:
         if len(backends) > 1:
-            fig = plt.figure(figsize=(12, len(backends)*1.5))
+            figsize = (12, len(backends)*1.5)
         else:
-            fig = plt.figure(figsize=(12, 2))
-    else:
-        fig = plt.figure(figsize=figsize)
+            figsize = (12, 2)
 
+    if use_pyplot:
+        import matplotlib.pyplot as plt
+        fig = plt.figure(figsize=figsize)
+    else:
+        # Render through Agg directly, bypassing pyplot and any interactive display hooks
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
     text_color = 'k'
     if offset is None:
         offset = 100 if len(backends) > 3 else 200
     offset = -offset
     if colors is None:
-        if len(backends) == 1:
-            colors = COLORS1
-        elif len(backends) == 2:
-            colors = COLORS2
-        elif len(backends) == 3:
-            colors = COLORS3
-        elif len(backends) == 4:
-            colors = COLORS4
-        elif len(backends) == 5:
-            colors = COLORS5
-        else:
-            colors = [COLORS14[kk % 14] for kk in range(len(backends))]
+        colors = _default_colors(len(backends))
     else:
         if len(colors) != len(backends):
             raise KaleidoscopeError('Number of colors does not match number of backends.')
 
     cx_errors = []
-    for idx, back in enumerate(backends):
-
-        back_props = back.properties().to_dict()
-
-        cx_errs = []
-        meas_errs = []
-        for gate in back_props['gates']:
-            if len(gate['qubits']) == 2:
-                # Ignore cx gates with values of 1.0
-                if gate['parameters'][0]['value'] != 1.0:
-                    cx_errs.append(gate['parameters'][0]['value'])
-
-        for qubit in back_props['qubits']:
-            for item in qubit:
-                if item['name'] == 'readout_error':
-                    meas_errs.append(item['value'])
-        cx_errors.append(100*np.asarray(cx_errs))
+    for _, back_props in meta:
+        cx_errs = np.fromiter((gate['parameters'][0]['value'] for gate in back_props['gates']
+                               if len(gate['qubits']) == 2), dtype=float)
+        # Ignore cx gates with values of 1.0
+        cx_errors.append(100*cx_errs[cx_errs != 1.0].astype(np.float32))
 
     max_cx_err = max([cerr.max() for cerr in cx_errors])
     min_cx_err = min([cerr.min() for cerr in cx_errors])
@@ -149,31 +147,34 @@ def cnot_error_density(backends,
             text_xval = 0.8*xlim[1]
         else:
             text_xval = 0.6*xlim[1]
+    xs = np.linspace(xlim[0], xlim[1], 2500, dtype=np.float32)
+    cx_densities = 100*_fft_kde(cx_errors, xs, covariance_factor)
+    # One closed polygon per backend: the density curve followed by its baseline
+    baseline = np.array([xs[-1], xs[0]], dtype=np.float32)
+    verts = []
     for idx, back in enumerate(backends):
-        cx_density = gaussian_kde(cx_errors[idx])
-        xs = np.linspace(xlim[0], xlim[1], 2500)
-        cx_density.covariance_factor = lambda: covariance_factor
-        cx_density._compute_covariance()
+        base = offset*idx
+        verts.append(np.column_stack((np.concatenate((xs, baseline)),
+                                      np.concatenate((cx_densities[idx]+base,
+                                                      np.full(2, base, dtype=np.float32))))))
 
-        if scale == 'linear':
-            plt.plot(xs, 100*cx_density(xs)+offset*idx, zorder=idx, color=colors[idx])
-        else:
-            plt.semilogx(xs, 100*cx_density(xs)+offset*idx, zorder=idx, color=colors[idx])
-        plt.fill_between(xs, offset*idx,
-                         100*cx_density(xs)+offset*idx, zorder=idx, color=colors[idx])
-
-        qv_val = back.configuration().quantum_volume
+        qv_val = meta[idx][0].quantum_volume
         if qv_val:
             qv = "(QV"+str(qv_val)+")"
         else:
             qv = ''
 
         bname = back.name().split('_')[-1].title()+" {}".format(qv)
-        plt.text(text_xval, offset*idx+0.2*(-offset), bname, fontsize=20, color=colors[idx])
+        ax.text(text_xval, offset*idx+0.2*(-offset), bname, fontsize=20, color=colors[idx])
 
-    fig.axes[0].get_yaxis().set_visible(False)
+    ax.add_collection(PolyCollection(verts, facecolors=colors, edgecolors=colors,
+                                     linewidths=1.5))
+    if scale == 'log':
+        ax.set_xscale('log')
+    ax.autoscale_view()
+    ax.get_yaxis().set_visible(False)
     # get rid of the frame
-    for spine in plt.gca().spines.values():
+    for spine in ax.spines.values():
         spine.set_visible(False)
 
     if xticks is None:
@@ -182,16 +183,102 @@ def cnot_error_density(backends,
     else:
         xticks = np.asarray(xticks)
     if xticks is not None:
-        plt.xticks(np.floor(xticks), labels=np.floor(xticks), color=text_color)
-    plt.xticks(fontsize=18)
-    plt.xlim(xlim)
-    plt.tick_params(axis='x', colors=text_color)
-    plt.xlabel('Gate Error', fontsize=18, color=text_color)
-    plt.title('CNOT Error Distributions', fontsize=18, color=text_color)
+        xticks = np.floor(xticks).tolist()
+        ax.set_xticks(xticks)
+        ax.set_xticklabels([str(tick) for tick in xticks], color=text_color)
+    ax.tick_params(axis='x', labelsize=18, colors=text_color)
+    ax.set_xlim(xlim)
+    ax.set_xlabel('Gate Error', fontsize=18, color=text_color)
+    ax.set_title('CNOT Error Distributions', fontsize=18, color=text_color)
     fig.tight_layout()
 
-    if mpl.get_backend() in ["module://ipykernel.pylab.backend_inline",
-                             "module://matplotlib_inline.backend_inline",
-                             "nbAgg"]:
+    if use_pyplot and mpl.get_backend() in ["module://ipykernel.pylab.backend_inline",
+                                            "module://matplotlib_inline.backend_inline",
+                                            "nbAgg"]:
         plt.close(fig)
     return fig
+
+
+def _backend_meta(backend):
+    """Fetch the configuration and properties of a backend.
+
+    Parameters:
+        backend (IBMQBackend or FakeBackend): Backend to query.
+
+    Returns:
+        tuple: Backend configuration and properties dict.
+    """
+    return backend.configuration(), backend.properties().to_dict()
+
+
+@functools.lru_cache(maxsize=16)
+def _default_colors(num_backends):
+    """Default colors for a given number of backends.
+
+    Parameters:
+        num_backends (int): Number of backends being plotted.
+
+    Returns:
+        tuple: Hex color strings, one per backend.
+    """
+    if num_backends in _PALETTES:
+        return tuple(_PALETTES[num_backends])
+    return tuple(COLORS14[kk % 14] for kk in range(num_backends))
+
+
+def _fft_kde(samples, xs, covariance_factor):
+    """Gaussian kernel density estimates evaluated on an evenly spaced grid.
+
+    All sample sets are binned onto the grid in a single pass and then
+    convolved with their Gaussian kernels (truncated at four bandwidths)
+    in one batched FFT.  The bandwidth of each kernel is
+    ``covariance_factor`` times the standard deviation of its samples,
+    as in ``scipy.stats.gaussian_kde``, but never less than the grid
+    spacing.  The grid is padded by the kernel half-width on both sides,
+    so samples just outside it still add their tails; only samples more
+    than four bandwidths outside contribute nothing.  Densities are
+    normalized by the total number of samples.
+
+    Parameters:
+        samples (list): List of 1D sample arrays, one per density.
+        xs (ndarray): Evenly spaced grid at which to evaluate the densities.
+        covariance_factor (float): Kernel width in units of the sample std.
+
+    Returns:
+        ndarray: Array of shape (len(samples), len(xs)) with the densities.
+    """
+    from scipy.signal import fftconvolve
+
+    num_sets = len(samples)
+    num_points = xs.shape[0]
+    lengths = np.array([smp.shape[0] for smp in samples])
+    rows = np.repeat(np.arange(num_sets), lengths)
+    flat = np.concatenate(samples)
+
+    dx = xs[1] - xs[0]
+    inv_dx = 1.0/dx
+
+    means = np.bincount(rows, weights=flat, minlength=num_sets) / lengths
+    variances = np.bincount(rows, weights=(flat-means[rows])**2,
+                            minlength=num_sets) / np.maximum(lengths-1, 1)
+    # Kernels narrower than a grid spacing cannot be resolved, and single-valued
+    # sample sets have no spread at all, so clamp the bandwidth to one bin.
+    bandwidths = np.maximum(covariance_factor*np.sqrt(variances), dx)
+    inv_bw = (1.0/bandwidths).astype(np.float32)
+    half_width = int(np.ceil(4*inv_dx/inv_bw.min()))
+    # Out-of-range samples go into padding cells on either side of the grid
+    padded = num_points + 2*half_width
+    bins = np.floor((flat - xs[0])*inv_dx + 0.5).astype(np.int64) + half_width
+    valid = (bins >= 0) & (bins < padded)
+    counts = np.bincount(rows[valid]*padded + bins[valid],
+                         minlength=num_sets*padded).reshape(num_sets, padded)
+
+    kernel = np.arange(-half_width, half_width+1, dtype=np.float32)*dx
+    kernels = np.exp(-0.5*(kernel[None, :]*inv_bw[:, None])**2) * \
+        (inv_bw[:, None]*np.float32(1/np.sqrt(2*np.pi)))
+
+    densities = fftconvolve(counts.astype(np.float32), kernels, mode='same', axes=1)
+    densities = densities[:, half_width:half_width+num_points] / \
+        lengths[:, None].astype(np.float32)
+    # FFT round-off can leave tiny negative values
+    return np.maximum(densities, 0)
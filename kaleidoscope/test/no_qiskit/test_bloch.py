@@ -15,7 +15,9 @@
 """Tests for Bloch routines"""
 
 import numpy as np
-from kaleidoscope.interactive.bloch.utils import bloch_components
+from kaleidoscope.interactive.bloch.utils import bloch_components, pauli_action
+from kaleidoscope.interactive.bloch.bloch3d import bloch_sphere
+from kaleidoscope.interactive.bloch import primitives
 
 
 def test_bloch_components():
@@ -36,3 +38,79 @@ def test_bloch_components():
     comp = bloch_components(state)
     assert np.allclose(comp[0], [0.0, 0.0, 0.0])
     assert np.allclose(comp[1], [0.0, 0.0, 0.0])
+
+
+def test_bloch_sphere_annotations():
+    """Tests vector annotations keep the input number format"""
+
+    fig = bloch_sphere([[0, 0, 1], [0.6, 0, 0.8]], vectors_annotation=True)
+    texts = [ann.text for ann in fig._fig.layout.scene.annotations]
+    assert texts == ['[0,<br> 0,<br> 1]', '[0.6,<br> 0.0,<br> 0.8]']
+
+
+def _dense_components(rho, num_qubits):
+    """Bloch components from dense Pauli operators, qubit 0 least significant"""
+    paulis = [np.array([[0, 1], [1, 0]]),
+              np.array([[0, -1j], [1j, 0]]),
+              np.array([[1, 0], [0, -1]])]
+    comps = []
+    for qubit in range(num_qubits):
+        comp = []
+        for pauli in paulis:
+            op = np.ones((1, 1))
+            for kk in range(num_qubits-1, -1, -1):
+                op = np.kron(op, pauli if kk == qubit else np.eye(2))
+            comp.append(np.real(np.trace(op @ rho)))
+        comps.append(comp)
+    return np.array(comps)
+
+
+def test_pauli_action_dense():
+    """Tests Pauli row entries against dense Kronecker products"""
+
+    paulis = {'X': np.array([[0, 1], [1, 0]]),
+              'Y': np.array([[0, -1j], [1j, 0]]),
+              'Z': np.array([[1, 0], [0, -1]])}
+    for num_qubits in range(1, 5):
+        dim = 2**num_qubits
+        for qubit in range(num_qubits):
+            for kind, pauli in paulis.items():
+                op = np.ones((1, 1))
+                for kk in range(num_qubits-1, -1, -1):
+                    op = np.kron(op, pauli if kk == qubit else np.eye(2))
+                data, cols = pauli_action(num_qubits, qubit, kind)
+                mat = np.zeros((dim, dim), dtype=complex)
+                mat[np.arange(dim), cols] = data
+                assert np.allclose(mat, op)
+
+
+def test_bloch_components_dense():
+    """Tests Bloch components against dense Pauli expectation values"""
+
+    rng = np.random.default_rng(1234)
+    for num_qubits in range(1, 7):
+        dim = 2**num_qubits
+        psi = rng.normal(size=dim) + 1j*rng.normal(size=dim)
+        psi /= np.linalg.norm(psi)
+        expected = _dense_components(np.outer(psi, psi.conj()), num_qubits)
+        assert np.allclose(bloch_components(psi), expected, atol=1e-12)
+
+        mat = rng.normal(size=(dim, dim)) + 1j*rng.normal(size=(dim, dim))
+        rho = mat @ mat.conj().T
+        rho /= np.trace(rho)
+        expected = _dense_components(rho, num_qubits)
+        assert np.allclose(bloch_components(rho), expected, atol=1e-12)
+
+
+def test_sphere_surface_not_shared():
+    """Tests that sphere surfaces can be modified without affecting later calls"""
+
+    surface = primitives.BSPHERE()
+    surface.opacity = 0.9
+    assert primitives.BSPHERE().opacity == 0.15
+    assert primitives.BSPHERE() is not primitives.BSPHERE()
+
+    # Mesh arrays of earlier releases remain available
+    u = np.linspace(0, 2*np.pi, 100)
+    assert np.allclose(primitives.u, u)
+    assert np.allclose(primitives.x, np.outer(np.cos(u), np.sin(u)))
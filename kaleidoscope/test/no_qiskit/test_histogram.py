@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Kaleidoscope.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for histogram distance measures"""
+
+import numpy as np
+from kaleidoscope.interactive import histogram
+from kaleidoscope.interactive.histogram import _hamming_distances
+
+
+def _naive_distances(labels, target):
+    """Character-by-character Hamming distances"""
+    return [sum(s1 != s2 for s1, s2 in zip(label, target)) for label in labels]
+
+
+def _random_bitstrings(rng, num_bits, num_labels=50):
+    """Random '0'/'1' labels and target of a given width"""
+    labels = [''.join(rng.choice(['0', '1'], size=num_bits)) for _ in range(num_labels)]
+    target = ''.join(rng.choice(['0', '1'], size=num_bits))
+    return labels, target
+
+
+def _force_packed_path(monkeypatch):
+    """Enables the packed branch of _hamming_distances on any NumPy version.
+
+    Returns:
+        list: Grows by one entry each time the packed branch runs.
+    """
+    calls = []
+    # NumPy < 2.0 has no bitwise_count, so count the unpacked bits instead
+    popcount = getattr(np, 'bitwise_count',
+                       lambda arr: np.unpackbits(arr[..., None], axis=-1).sum(axis=-1))
+
+    def bitwise_count(arr):
+        calls.append(arr.shape)
+        return popcount(arr)
+
+    monkeypatch.setattr(histogram, '_HAS_BITWISE_COUNT', True)
+    monkeypatch.setattr(np, 'bitwise_count', bitwise_count, raising=False)
+    return calls
+
+
+def test_hamming_distances():
+    """Tests batched Hamming distances with the installed NumPy"""
+    rng = np.random.default_rng(1234)
+    for num_bits in [1, 7, 8, 63, 64, 65, 100, 130]:
+        labels, target = _random_bitstrings(rng, num_bits)
+        dists = _hamming_distances(labels, target)
+        assert dists.tolist() == _naive_distances(labels, target)
+
+
+def test_hamming_distances_packed(monkeypatch):
+    """Tests the packed bit-count path taken past 64 bits"""
+    calls = _force_packed_path(monkeypatch)
+    rng = np.random.default_rng(4321)
+    for num_bits in [65, 72, 100, 130]:
+        labels, target = _random_bitstrings(rng, num_bits)
+        dists = _hamming_distances(labels, target)
+        assert dists.tolist() == _naive_distances(labels, target)
+    assert len(calls) == 4
+
+    # At or below one machine word the byte comparison is used
+    labels, target = _random_bitstrings(rng, 64)
+    _hamming_distances(labels, target)
+    assert len(calls) == 4
+
+
+def test_hamming_distances_non_binary(monkeypatch):
+    """Tests labels outside '0'/'1' skip the packed path"""
+    calls = _force_packed_path(monkeypatch)
+    labels = ['2' * 70, '0' * 69 + '2', 'a' * 70]
+    target = '0' * 70
+    dists = _hamming_distances(labels, target)
+    assert dists.tolist() == _naive_distances(labels, target)
+    assert not calls
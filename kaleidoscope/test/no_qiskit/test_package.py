@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Kaleidoscope.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the top-level package namespace"""
+
+import types
+import kaleidoscope
+
+
+def test_subpackages_resolve():
+    """Tests subpackages are reachable after a plain import"""
+    for name in ['interactive', 'colors', 'utils']:
+        assert isinstance(getattr(kaleidoscope, name), types.ModuleType)
+        assert name in dir(kaleidoscope)
+    assert kaleidoscope.interactive.qsphere is kaleidoscope.qsphere
+
+
+def test_private_names_hidden():
+    """Tests version lookup helpers do not leak into the namespace"""
+    assert 'PackageNotFoundError' not in dir(kaleidoscope)
+    assert not hasattr(kaleidoscope, 'PackageNotFoundError')
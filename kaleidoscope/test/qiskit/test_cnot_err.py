@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Kaleidoscope.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the CNOT error density"""
+
+import numpy as np
+from scipy.stats import gaussian_kde
+from kaleidoscope.qiskit.backends.mpl.cnot_err import _fft_kde
+
+
+def test_fft_kde_matches_gaussian_kde():
+    """Tests the binned KDE against scipy, including samples off the grid"""
+
+    rng = np.random.default_rng(7)
+    samples = [rng.lognormal(0, 0.4, size=50),
+               rng.normal(2, 0.3, size=200),
+               rng.normal(3.9, 0.5, size=80)]
+    xs = np.linspace(0, 4, 2500, dtype=np.float32)
+    densities = _fft_kde([smp.astype(np.float32) for smp in samples], xs, 0.1)
+
+    for smp, dens in zip(samples, densities):
+        kde = gaussian_kde(smp)
+        kde.set_bandwidth(0.1)
+        expected = kde(xs)
+        assert np.max(np.abs(dens - expected)) < 1e-2 * np.max(expected)
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Kaleidoscope.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the error map"""
+
+import copy
+from qiskit.providers.fake_provider import Fake5QV1
+from kaleidoscope.qiskit.backends import system_error_map
+
+
+def _readout_errors(fig):
+    bars = [trace for trace in fig._fig.data if trace.type == 'bar']
+    return list(bars[0].x)
+
+
+def test_error_map_edited_properties():
+    """Tests edited properties are not served from the cache"""
+
+    backend = Fake5QV1()
+    base = _readout_errors(system_error_map(backend.properties()))
+
+    props = copy.deepcopy(backend.properties())
+    for item in props.qubits[0]:
+        if item.name == 'readout_error':
+            item.value = 0.4
+    edited = _readout_errors(system_error_map(props))
+
+    assert edited[0] == 0.4
+    assert edited[1:] == base[1:]
+    assert _readout_errors(system_error_map(backend)) == base
+
+
+class _CachedPropertiesBackend(Fake5QV1):
+    """Fake backend returning one properties object, as device backends do"""
+
+    def __init__(self):
+        super().__init__()
+        self._props = super().properties()
+
+    def properties(self):
+        return self._props
+
+
+def test_error_map_properties_edited_in_place():
+    """Tests in-place edits of a backend's properties are not served from the cache"""
+
+    backend = _CachedPropertiesBackend()
+    base = _readout_errors(system_error_map(backend))
+
+    for item in backend.properties().qubits[0]:
+        if item.name == 'readout_error':
+            item.value = 0.4
+    edited = _readout_errors(system_error_map(backend))
+
+    assert edited[0] == 0.4
+    assert edited[1:] == base[1:]
@@ -14,11 +14,14 @@
 
 """Tests for Bloch routines"""
 
+from math import comb
+import numpy as np
 import pytest
 from qiskit import QuantumCircuit
 from qiskit. quantum_info import DensityMatrix, partial_trace
 from kaleidoscope import qsphere
 from kaleidoscope.errors import KaleidoscopeError
+from kaleidoscope.interactive.qsphere import _BINOM, _qsphere_geometry
 
 
 def test_qsphere_bad_dm_input():
@@ -32,3 +35,36 @@ def test_qsphere_bad_dm_input():
     pdm = partial_trace(dm, [0, 1])
     with pytest.raises(KaleidoscopeError):
         assert qsphere(pdm)
+
+
+def _reference_point(idx, num_qubits):
+    """Qsphere position from the original bit-string lex index formula"""
+    elem = bin(idx)[2:].zfill(num_qubits)
+    weight = elem.count("1")
+    zvalue = -2 * weight / num_qubits + 1
+    number_of_divisions = comb(num_qubits, weight)
+    ones = [num_qubits - 1 - pos for pos, char in enumerate(elem) if char == "1"]
+    weight_order = sum(comb(ones[weight - 1 - i], i + 1) for i in range(weight))
+    angle = (float(weight) / num_qubits) * (np.pi * 2) + \
+        (weight_order * 2 * (np.pi / number_of_divisions))
+    if (weight > num_qubits / 2) or (((weight == num_qubits / 2) and
+                                      (weight_order >= number_of_divisions / 2))):
+        angle = np.pi - angle - (2 * np.pi / number_of_divisions)
+    return (np.sqrt(1 - zvalue ** 2) * np.cos(angle),
+            np.sqrt(1 - zvalue ** 2) * np.sin(angle),
+            zvalue)
+
+
+def test_qsphere_geometry():
+    """Tests qsphere positions and phases against the reference formula"""
+
+    rng = np.random.default_rng(42)
+    for num_qubits in range(3, 6):
+        idx = np.arange(2**num_qubits, dtype=np.int64)
+        amps = rng.normal(size=idx.size) + 1j*rng.normal(size=idx.size)
+        xvals, yvals, zvals, phases = _qsphere_geometry(idx, amps, num_qubits, _BINOM)
+        expected = np.array([_reference_point(kk, num_qubits) for kk in idx])
+        assert np.allclose(xvals, expected[:, 0], atol=1e-12)
+        assert np.allclose(yvals, expected[:, 1], atol=1e-12)
+        assert np.allclose(zvals, expected[:, 2], atol=1e-12)
+        assert np.allclose(phases, np.mod(np.angle(amps), 2*np.pi), atol=1e-12)
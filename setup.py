@@ -31,9 +31,9 @@ ISRELEASED = False
 VERSION = '%d.%d.%d' % (MAJOR, MINOR, MICRO)
 
 REQUIREMENTS = ['numpy>=1.15',
-                'scipy>=1.3',
+                'scipy>=1.5',
                 'numba>=0.46',
-                'plotly>=4.6',
+                'plotly>=5.6',
                 'matplotlib>=3.1',
                 'seaborn>=0.9.0',
                 'jupyter',
@@ -156,14 +156,13 @@ setuptools.setup(
         "Operating System :: Microsoft :: Windows",
         "Operating System :: MacOS",
         "Operating System :: POSIX :: Linux",
-        "Programming Language :: Python :: 3.5",
-        "Programming Language :: Python :: 3.6",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Topic :: Scientific/Engineering",
     ],
     cmdclass={'lint': PylintCommand, 'style': StyleCommand},
     install_requires=REQUIREMENTS,
+    python_requires=">=3.7",
     package_data=PACKAGE_DATA,
     include_package_data=True,
     zip_safe=False